@@ -1,7 +1,29 @@
+import logging
+import time
+import uuid
+
 import streamlit as st
 import pandas as pd
-import joblib
 import plotly.express as px
+import plotly.graph_objects as go
+
+from app_state import get_state_loader
+from build_static import build as build_static_pages
+from catalog import unique_canonical
+from catalog_registry import get_catalog_registry
+from category_tagger import category_counts as course_category_counts
+from catalog_explorer import bin_centers
+from course_table import SORT_COLUMNS
+from diagnostics import diagnostics_requested, render_diagnostics
+from event_log import get_event_log
+from guidance import career_guidance, skill_gap_advice
+from instrumentation import timed, count, observe
+from memory_profile import get_tracker
+from organizations import suggest_university
+from recommendations import blend_recommendations
+from shadow_model import get_shadow, start_shadow
+from student_data import generate_students
+from student_neighbours import StudentNeighbours
 
 # =====================================================
 # Page configuration
@@ -11,13 +33,45 @@ st.set_page_config(
     layout="wide"
 )
 
+if diagnostics_requested():
+    render_diagnostics()
+    st.stop()
+
+page_start = time.perf_counter()
+rerun_timer = timed("rerun")
+count("reruns")
+
+first_run = "session_id" not in st.session_state
+session_id = st.session_state.setdefault("session_id", uuid.uuid4().hex)
+
+memory_tracker = get_tracker()
+if memory_tracker is not None:
+    memory_tracker.on_rerun(session_id)
+
 # =====================================================
-# Load model and dataset
+# Start loading model and dataset
 # =====================================================
-model = joblib.load("course_model.pkl")
-
-courses = pd.read_csv("data/coursea_data.csv")
-courses = courses.loc[:, ~courses.columns.str.contains("^Unnamed")]
+# The state (app_state.bundle when up to date, otherwise course_model.pkl
+# and the catalog CSV) loads on a background thread while the page
+# skeleton and the static tabs render, and is reloaded when those files
+# change.
+@st.cache_resource
+def ensure_static_pages():
+    # Rebuilds static/guidance only when the guidance content has changed.
+    # The export is a by-product for file servers: failing to write it
+    # (e.g. a read-only app directory) must not break the app
+    try:
+        return build_static_pages()
+    except OSError as exc:
+        count("static_build_failures")
+        logging.getLogger(__name__).warning("Could not export the guidance pages: %s", exc)
+        return False
+
+state_loader = get_state_loader()
+event_log = get_event_log()
+# The candidate model (shadow mode only) loads off the request path too
+start_shadow()
+ensure_static_pages()
 
 # =====================================================
 # Global Options
@@ -39,97 +93,22 @@ interest_areas = ["Data Science", "Business", "Computer Science"]
 # =====================================================
 # Helper Functions
 # =====================================================
-def get_top_courses(course_type, top_n=3):
+def explanation_frame(profile, contributions):
     """
-    Returns top_n courses and their organizations based on course_type.
+    Contribution table for one profile, largest effect first. Categories
+    the model was not trained on contribute nothing and are marked.
     """
-    if course_type == "Data":
-        df = courses[courses["course_title"].str.contains("data|analytics", case=False)]
-    elif course_type == "Programming":
-        df = courses[courses["course_title"].str.contains("python|program|software", case=False)]
-    else:
-        df = courses[courses["course_title"].str.contains("business|management", case=False)]
-
-    df = df.dropna(subset=["course_title", "course_organization"])
-    top_courses = df.head(top_n)[["course_title", "course_organization"]]
-    return top_courses
-
-# Career guidance dictionary
-def career_guidance(career):
-    guidance = {
-        "Data Analyst": {
-            "Overview": "Analyze structured data to support operational and strategic decisions.",
-            "Core Skills": ["Statistics and probability", "SQL and Python", "Data visualization"],
-            "Tools": ["Excel", "SQL", "Python", "Power BI"],
-            "Career Path": ["Junior Data Analyst", "Senior Data Analyst", "Data Scientist"]
-        },
-        "Data Scientist": {
-            "Overview": "Develop predictive models and advanced analytics solutions.",
-            "Core Skills": ["Machine learning", "Advanced statistics", "Big data processing"],
-            "Tools": ["Python", "R", "TensorFlow", "Spark"],
-            "Career Path": ["Data Scientist", "Senior Data Scientist", "AI Engineer"]
-        },
-        "Software Engineer": {
-            "Overview": "Design, build, and maintain scalable software systems.",
-            "Core Skills": ["Algorithms and data structures", "System design", "Software testing"],
-            "Tools": ["Python", "Java", "Git", "Docker"],
-            "Career Path": ["Junior Software Engineer", "Senior Software Engineer", "Technical Lead"]
-        },
-        "AI / ML Engineer": {
-            "Overview": "Deploy and optimize AI and machine learning systems.",
-            "Core Skills": ["Deep learning", "Model optimization", "MLOps"],
-            "Tools": ["PyTorch", "TensorFlow", "MLflow"],
-            "Career Path": ["ML Engineer", "AI Engineer", "AI Architect"]
-        },
-        "Business Analyst": {
-            "Overview": "Translate business problems into data-driven solutions.",
-            "Core Skills": ["Business analysis", "Decision modeling", "Communication"],
-            "Tools": ["Excel", "SQL", "Power BI"],
-            "Career Path": ["Business Analyst", "Senior BA", "Product Manager"]
-        },
-        "Cybersecurity Analyst": {
-            "Overview": "Protect systems and data from cyber threats.",
-            "Core Skills": ["Network security", "Risk assessment", "Incident response"],
-            "Tools": ["Wireshark", "Metasploit", "SIEM tools"],
-            "Career Path": ["Security Analyst", "Security Engineer", "Security Architect"]
-        },
-        "Product Manager": {
-            "Overview": "Define product vision and coordinate cross-functional teams.",
-            "Core Skills": ["Product strategy", "User research", "Stakeholder management"],
-            "Tools": ["JIRA", "Figma", "Analytics tools"],
-            "Career Path": ["Associate PM", "Product Manager", "Senior PM"]
-        }
-    }
-    return guidance[career]
-
-# Skill gap advice
-def skill_gap_advice(career, level):
-    general = {
-        "Beginner": {
-            "Focus": "Build strong fundamentals",
-            "Actions": ["Take introductory courses", "Practice basic exercises", "Learn core tools"]
-        },
-        "Intermediate": {
-            "Focus": "Apply knowledge practically",
-            "Actions": ["Complete hands-on projects", "Work with real datasets", "Participate in internships"]
-        },
-        "Advanced": {
-            "Focus": "Specialize and master skills",
-            "Actions": ["Advanced coursework", "Research papers", "Capstone projects"]
-        }
-    }
-
-    career_specific = {
-        "Data Analyst": "Focus on dashboards and business reporting.",
-        "Data Scientist": "Improve model tuning and feature engineering.",
-        "Software Engineer": "Practice system design and scalability.",
-        "AI / ML Engineer": "Deploy and optimize ML pipelines.",
-        "Business Analyst": "Strengthen decision analysis and communication.",
-        "Cybersecurity Analyst": "Practice penetration testing and monitoring.",
-        "Product Manager": "Work on product case studies and roadmaps."
-    }
-
-    return general[level], career_specific[career]
+    values = []
+    for feature in explainer.input_features:
+        value = str(profile[feature])
+        known = explainer.categories.get(feature)
+        values.append(value if known is None or value in known else f"{value} (unseen in training)")
+    frame = pd.DataFrame({
+        "input": explainer.input_features,
+        "value": values,
+        "contribution": contributions.round(3)
+    })
+    return frame.iloc[(-frame["contribution"].abs()).argsort(kind="stable")]
 
 # =====================================================
 # App Title
@@ -146,41 +125,19 @@ tab1, tab2, tab3, tab4 = st.tabs([
     "📊 Course Trends"
 ])
 
-# =====================================================
-# TAB 1 — Course Recommendation
-# =====================================================
-with tab1:
-    st.subheader("Student Profile")
-    col1, col2 = st.columns(2)
-
-    with col1:
-        cgpa = st.slider("CGPA", 2.5, 4.0, 3.0, 0.1)
-        interest = st.selectbox("Interest Area", interest_areas)
-
-    with col2:
-        career = st.selectbox("Career Goal", career_options)
-        skill = st.selectbox("Skill Level", skill_levels)
-
-    if st.button("🎯 Recommend Course"):
-        input_df = pd.DataFrame([{
-            "cgpa": cgpa,
-            "interest": interest,
-            "career_goal": career,
-            "skill_level": skill
-        }])
-
-        course_type = model.predict(input_df)[0]
-        top_courses = get_top_courses(course_type, top_n=3)
-
-        st.success(f"✅ Recommended Course Category: **{course_type}**")
-        st.markdown("### 📘 Suggested Courses & Universities:")
-        for idx, row in top_courses.iterrows():
-            st.write(f"- {row['course_title']}  |  {row['course_organization']}")
+# Tabs 1 and 4 need the model and catalog; show a placeholder until ready
+if not state_loader.ready():
+    tab1_loading = tab1.empty()
+    tab4_loading = tab4.empty()
+    tab1_loading.info("⏳ Loading courses and model…")
+    tab4_loading.info("⏳ Loading course data…")
+else:
+    tab1_loading = tab4_loading = None
 
 # =====================================================
 # TAB 2 — Career Path Guidance
 # =====================================================
-with tab2:
+with tab2, timed("render_tab2"):
     st.subheader("Career Roadmap")
     selected_career = st.selectbox("Select Career", career_options, key="career_tab2")
     guide = career_guidance(selected_career)
@@ -203,7 +160,7 @@ with tab2:
 # =====================================================
 # TAB 3 — Skill Gap & Study Advice
 # =====================================================
-with tab3:
+with tab3, timed("render_tab3"):
     st.subheader("Personalized Learning Plan")
     col1, col2 = st.columns(2)
 
@@ -220,22 +177,313 @@ with tab3:
         st.write("•", a)
     st.info(f"💡 Career-Specific Advice: {career_specific}")
 
+    # The course path needs the catalog and is filled in once it is loaded
+    path_slot = st.empty()
+    if not state_loader.ready():
+        path_slot.info("⏳ Loading course path…")
+
+if first_run:
+    observe("time_to_first_paint", time.perf_counter() - page_start)
+
+# =====================================================
+# Wait for model and dataset
+# =====================================================
+# Taken once per rerun: a refresh swapping in a new catalog midway does
+# not affect this rerun
+with timed("state_wait"):
+    resources = state_loader.result()
+
+# Partner institutions' catalogs (data/catalogs/*.csv) load on first use
+catalog_registry = get_catalog_registry()
+if catalog_registry.names:
+    with st.sidebar:
+        institution = st.selectbox(
+            "🏛️ Institution", ["Coursera"] + catalog_registry.names, key="institution"
+        )
+    if institution != "Coursera":
+        with st.spinner(f"Loading the {institution} catalog…"):
+            resources = catalog_registry.get(institution, resources["state"])
+
+state = resources["state"]
+explainer = resources["explainer"]
+facets = resources["facets"]
+course_table = resources["course_table"]
+explorer = resources["explorer"]
+org_aggregates = resources["org_aggregates"]
+
+model = state.model
+courses = state.courses
+title_index = state.title_index
+similarity_index = state.similarity_index
+category_rankings = state.category_rankings
+learning_paths = state.learning_paths
+model_version = state.model_version
+
+@st.cache_resource
+def load_student_index():
+    # The students course_model.pkl was trained on
+    return StudentNeighbours.from_frame(generate_students())
+
+student_index = load_student_index()
+
+# A catalog refresh replaces everything above at once; keep per-session
+# picks only while they refer to the catalog they were made on
+if st.session_state.get("state_version") != resources["version"]:
+    st.session_state["state_version"] = resources["version"]
+    st.session_state.pop("suggested_ids", None)
+    st.session_state.pop("similar_pick", None)
+    for facet in facets.bitmaps:
+        chosen = st.session_state.get(f"facet_{facet}", [])
+        st.session_state[f"facet_{facet}"] = [v for v in chosen if v in facets.bitmaps[facet]]
+
+for placeholder in (tab1_loading, tab4_loading):
+    if placeholder is not None:
+        placeholder.empty()
+
+# =====================================================
+# TAB 1 — Course Recommendation
+# =====================================================
+with tab1, timed("render_tab1"):
+    st.subheader("Student Profile")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        cgpa = st.slider("CGPA", 2.5, 4.0, 3.0, 0.1)
+        interest = st.selectbox("Interest Area", interest_areas)
+
+    with col2:
+        career = st.selectbox("Career Goal", career_options)
+        skill = st.selectbox("Skill Level", skill_levels)
+
+    if st.button("🎯 Recommend Course"):
+        input_df = pd.DataFrame([{
+            "cgpa": cgpa,
+            "interest": interest,
+            "career_goal": career,
+            "skill_level": skill
+        }])
+
+        started = time.perf_counter()
+        with timed("model_predict"):
+            if explainer is not None:
+                probabilities, contributions = explainer.explain(input_df)
+                probabilities, contributions = probabilities[0], contributions[0]
+            else:
+                # Not a linear model: predictions only, no explanation
+                probabilities, contributions = model.predict_proba(input_df)[0], None
+        course_type = model.classes_[probabilities.argmax()]
+        live_seconds = time.perf_counter() - started
+
+        # Candidate model scores the same request off the response path;
+        # skipped while it is still loading
+        shadow = get_shadow()
+        if shadow is not None:
+            shadow.submit(input_df, course_type, live_seconds, session_id, model_version)
+        with timed("blend_recommendations"):
+            suggestions = blend_recommendations(
+                category_rankings, model.classes_, probabilities, top_n=3
+            )
+        count("recommendations")
+
+        event_log.emit(
+            "recommendation_shown",
+            session=session_id,
+            profile=input_df.iloc[0].to_dict(),
+            predicted_category=course_type,
+            probabilities=dict(zip(model.classes_, probabilities.round(4).tolist())),
+            course_ids=[course_id for course_id, _ in suggestions],
+            model_version=model_version,
+            latency_ms=round(1000 * (time.perf_counter() - started), 3)
+        )
+
+        st.success(f"✅ Recommended Course Category: **{course_type}**")
+        st.caption(" · ".join(
+            f"{c}: {p:.0%}" for c, p in sorted(
+                zip(model.classes_, probabilities), key=lambda cp: -cp[1]
+            )
+        ))
+        if contributions is not None:
+            with st.expander("🧩 Why this recommendation?"):
+                st.caption(
+                    f"Each input's contribution (coefficient × value) to the {course_type} score; "
+                    "positive values pushed the model toward it."
+                )
+                st.dataframe(
+                    explanation_frame(input_df.iloc[0], contributions),
+                    use_container_width=True,
+                    hide_index=True
+                )
+
+        st.markdown("### 📘 Suggested Courses & Universities:")
+        for course_id, category in suggestions:
+            row = courses.loc[course_id]
+            st.write(f"- {row['course_title']}  |  {row['course_organization']}  ({category})")
+
+        university = suggest_university(org_aggregates, course_type)
+        if university is not None:
+            st.warning(
+                f"🏫 Suggested University / Organization: **{university['organization']}** — "
+                f"{university['courses']} {course_type} courses, "
+                f"rated {university['mean_rating']:.2f} on average, "
+                f"{university['students_enrolled']:,.0f} students enrolled"
+            )
+
+        with timed("similar_students"):
+            neighbour_ids, _ = student_index.query(input_df.iloc[0], k=25)
+        shares = student_index.outcome_shares(neighbour_ids)
+        st.markdown("### 👥 Students Like You")
+        st.write(
+            f"Among the {len(neighbour_ids)} most similar students, "
+            + ", ".join(f"{share:.0%} took {label} courses" for label, share in shares.items())
+            + "."
+        )
+
+        st.session_state["suggested_ids"] = [course_id for course_id, _ in suggestions]
+        st.session_state["facet_Category"] = [course_type]
+
+    if st.session_state.get("suggested_ids"):
+        st.markdown("### 🔗 Similar Courses")
+        picked = st.selectbox(
+            "Pick a suggested course",
+            st.session_state["suggested_ids"],
+            format_func=lambda i: courses.at[i, "course_title"],
+            key="similar_pick",
+            on_change=lambda: event_log.emit(
+                "course_selected",
+                session=session_id,
+                course_id=st.session_state["similar_pick"],
+                model_version=model_version
+            )
+        )
+        neighbours = [i for i, _ in similarity_index.similar_to(picked, k=10)]
+        canonical_ids = courses["canonical_id"].to_numpy()
+        for course_id in unique_canonical(canonical_ids, neighbours, exclude=picked, limit=5):
+            row = courses.loc[course_id]
+            st.write(f"- {row['course_title']}  |  {row['course_organization']}")
+
+    # Sidebar facets, rendered here so the Recommend button above can
+    # preselect the category before the widget is created
+    with st.sidebar, timed("facet_counts"):
+        st.header("🧭 Filter Courses")
+        selection = {
+            facet: st.session_state.get(f"facet_{facet}", [])
+            for facet in facets.bitmaps
+        }
+        facet_counts = facets.counts(selection)
+        for facet in facets.bitmaps:
+            selection[facet] = st.multiselect(
+                facet,
+                facets.options(facet),
+                format_func=lambda value, facet=facet: f"{value} ({facet_counts[facet][value]})",
+                key=f"facet_{facet}"
+            )
+
+    st.markdown("### 📋 Browse Matching Courses")
+    col1, col2 = st.columns(2)
+    with col1:
+        sort_by = st.selectbox("Sort by", list(SORT_COLUMNS), key="browse_sort")
+    with col2:
+        descending = st.toggle("Descending", value=True, key="browse_descending")
+
+    page_size = 10
+    total = course_table.count(selection, sort_by, descending)
+    n_pages = max(1, -(-total // page_size))
+    st.session_state["browse_page"] = min(st.session_state.get("browse_page", 1), n_pages)
+    page = st.number_input("Page", min_value=1, max_value=n_pages, key="browse_page")
+
+    with timed("browse_page"):
+        rows, total = course_table.page(
+            page, page_size, selection, sort_by, descending
+        )
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+    st.caption(f"Page {page} of {n_pages} · {total} courses")
+
+    st.markdown("### 🔎 Search the Catalog")
+    query = st.text_input("Course title", key="title_search")
+    if query:
+        matches = title_index.search(query, top_n=5)
+        if matches:
+            for doc_id, _ in matches:
+                row = courses.iloc[doc_id]
+                st.write(f"- {row['course_title']}  |  {row['course_organization']}")
+        else:
+            st.warning("No matching courses found.")
+
+# =====================================================
+# TAB 3 — Course Path (needs the catalog)
+# =====================================================
+with path_slot.container():
+    st.markdown("### 🗺️ Suggested Course Path")
+    path = learning_paths.get((chosen_career, difficulty), [])
+    if path:
+        for step, course_id in enumerate(path, start=1):
+            row = courses.loc[course_id]
+            st.write(
+                f"{step}. {row['course_title']}  |  {row['course_organization']}  "
+                f"({row['course_difficulty']}, ⭐ {row['course_rating']})"
+            )
+    else:
+        st.info(f"No {difficulty} courses in the catalog for this career yet.")
+
 # =====================================================
 # TAB 4 — Course Trends
 # =====================================================
-with tab4:
+with tab4, timed("render_tab4"):
     st.subheader("Course Category Trends")
 
-    courses["category"] = courses["course_title"].str.extract("(Data|Python|Business)", expand=False)
-    category_counts = courses["category"].value_counts().reset_index()
-    category_counts.columns = ["Category", "Number of Courses"]
-
-    fig = px.bar(
-        category_counts,
-        x="Category",
-        y="Number of Courses",
-        text="Number of Courses",
-        title="Distribution of Available Courses"
+    category_counts = pd.DataFrame(
+        list(course_category_counts(courses).items()),
+        columns=["Category", "Number of Courses"]
     )
-    fig.update_layout(template="plotly_white")
+
+    with timed("figure_build"):
+        fig = px.bar(
+            category_counts,
+            x="Category",
+            y="Number of Courses",
+            text="Number of Courses",
+            title="Distribution of Available Courses"
+        )
+        fig.update_layout(template="plotly_white")
     st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("### 🔬 Rating vs Enrollment Explorer")
+    col1, col2 = st.columns(2)
+    with col1:
+        rating_range = st.slider(
+            "Rating range", *explorer.x_range, explorer.x_range,
+            step=0.01, key="explorer_rating"
+        )
+    with col2:
+        enrolled_range = st.slider(
+            "Students enrolled (log10)", *explorer.y_range, explorer.y_range,
+            step=0.01, key="explorer_enrolled"
+        )
+
+    with timed("explorer_binning"):
+        counts, x_edges, y_edges = explorer.viewport(rating_range, enrolled_range)
+
+    with timed("figure_build"):
+        heatmap = go.Figure(go.Heatmap(
+            x=bin_centers(x_edges),
+            y=bin_centers(y_edges),
+            z=counts.T,
+            colorscale="Blues",
+            hovertemplate="Rating %{x:.2f}<br>log10 enrolled %{y:.2f}<br>%{z:.0f} courses<extra></extra>"
+        ))
+        heatmap.update_layout(
+            template="plotly_white",
+            title=f"{int(counts.sum())} courses in view",
+            xaxis_title="Course rating",
+            yaxis=dict(
+                title="Students enrolled",
+                tickvals=[3, 4, 5, 6],
+                ticktext=["1k", "10k", "100k", "1M"]
+            )
+        )
+    st.plotly_chart(heatmap, use_container_width=True)
+
+if first_run:
+    observe("time_to_interactive", time.perf_counter() - page_start)
+
+rerun_timer.stop()
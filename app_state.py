@@ -0,0 +1,438 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from catalog import CATALOG_PATH, VARIANT_WORDS, Catalog, catalog_arrays, load_catalog, dedup_stats, searchable_titles
+from catalog_explorer import BinnedExplorer
+from category_tagger import CATEGORY_RULES
+from course_search import TrigramIndex
+from course_table import CourseTable
+from facets import FacetIndex
+from instrumentation import count, timed
+from learning_paths import CAREER_CATEGORIES, LEVELS, PATH_STEPS, build_learning_paths
+from linear_model import LinearModel
+from organizations import OrganizationAggregates
+from recommendations import build_category_rankings
+from similar_courses import SimilarCourseIndex, embed_titles
+from state_bundle import Bundle, write_bundle, pack_strings, unpack_strings
+
+# =====================================================
+# Settings
+# =====================================================
+MODEL_PATH = "course_model.pkl"
+BUNDLE_PATH = "app_state.bundle"
+
+# Seconds between checks of the model and catalog files (0 = never reload)
+REFRESH_SECONDS = float(os.environ.get("SMS_REFRESH_SECONDS", "10"))
+# Seconds between checks after a failed first load when refreshing is off
+RETRY_SECONDS = 5
+
+# Bumped whenever the bundle contents change, so older bundles are rebuilt
+STATE_LAYOUT = 5
+
+STRING_COLUMNS = ["course_title", "course_organization", "course_students_enrolled", "title_key"]
+CODED_COLUMNS = ["course_Certificate_type", "course_difficulty"]
+NUMERIC_COLUMNS = ["course_rating", "students_enrolled"]
+ID_COLUMNS = ["canonical_id", "category_mask"]
+
+# =====================================================
+# Application state
+# =====================================================
+class AppState:
+    """
+    Everything the app needs before it can answer a request.
+    """
+
+    def __init__(self, model, courses, title_index, similarity_index,
+                 category_rankings, learning_paths, model_version, source):
+        self.model = model
+        self.catalog = courses if isinstance(courses, Catalog) else Catalog.from_frame(courses)
+        self.title_index = title_index
+        self.similarity_index = similarity_index
+        self.category_rankings = category_rankings
+        self.learning_paths = learning_paths
+        self.model_version = model_version
+        self.source = source
+
+    @property
+    def courses(self):
+        # A fresh zero-copy frame per caller over the shared read-only catalog
+        return self.catalog.frame()
+
+def file_fingerprint(path):
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+def rules_fingerprint():
+    """
+    Hash of the configurable rules derived data is built with: category
+    keywords, title variant words and learning path settings.
+    """
+    rules = {
+        "category_rules": CATEGORY_RULES,
+        "variant_words": VARIANT_WORDS.pattern,
+        "career_categories": CAREER_CATEGORIES,
+        "levels": LEVELS,
+        "path_steps": PATH_STEPS
+    }
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode()).hexdigest()[:12]
+
+def model_version_of(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+def build_state(model_path=MODEL_PATH, catalog_path=CATALOG_PATH, model=None, model_version=None):
+    """
+    Builds the state from the pickled model and the catalog CSV. A model
+    that is already loaded can be passed, with its version, instead.
+    """
+    if model is None:
+        with timed("model_load"):
+            model = joblib.load(model_path)
+        model_version = model_version_of(model_path)
+
+    with timed("catalog_load"):
+        courses = load_catalog(catalog_path)
+
+    with timed("index_build"):
+        title_index = TrigramIndex(searchable_titles(courses))
+        titles = courses["course_title"].fillna("").tolist()
+        similarity_index = SimilarCourseIndex.build(embed_titles(titles))
+        category_rankings = build_category_rankings(courses)
+        learning_paths = build_learning_paths(courses)
+
+    return AppState(
+        model, courses, title_index, similarity_index, category_rankings,
+        learning_paths, model_version, source="sources"
+    )
+
+# =====================================================
+# Bundle export / import
+# =====================================================
+def write_state_bundle(state, path=BUNDLE_PATH, model_path=MODEL_PATH, catalog_path=CATALOG_PATH):
+    """
+    Packs the model parameters, catalog columns, category rankings and
+    search indexes of state into one bundle file.
+    """
+    model = state.model
+    if not isinstance(model, LinearModel):
+        model = LinearModel.from_pipeline(model)
+
+    arrays = {
+        "model.coef": model.coef_,
+        "model.intercept": model.intercept_
+    }
+
+    courses = state.courses
+    for column in STRING_COLUMNS:
+        arrays.update(pack_strings(courses[column].tolist(), f"catalog.{column}"))
+    coded = {}
+    for column in CODED_COLUMNS:
+        codes, labels = pd.factorize(courses[column])
+        arrays[f"catalog.{column}"] = codes.astype(np.int16)
+        coded[column] = [str(label) for label in labels]
+    for column in NUMERIC_COLUMNS:
+        arrays[f"catalog.{column}"] = courses[column].to_numpy(dtype=float)
+    for column in ID_COLUMNS:
+        arrays[f"catalog.{column}"] = courses[column].to_numpy(dtype=np.int64)
+    arrays["catalog.index"] = courses.index.to_numpy(dtype=np.int64)
+
+    for category, ids in state.category_rankings.items():
+        arrays[f"rankings.{category}"] = np.asarray(ids, dtype=np.int64)
+
+    paths = list(state.learning_paths.items())
+    arrays["paths.ids"] = np.array([i for _, ids in paths for i in ids], dtype=np.int64)
+    arrays["paths.offsets"] = np.cumsum([0] + [len(ids) for _, ids in paths], dtype=np.int64)
+
+    grams, offsets, ids = state.title_index.to_arrays()
+    arrays.update(pack_strings(grams, "trigram.grams"))
+    arrays["trigram.offsets"] = offsets
+    arrays["trigram.ids"] = ids
+
+    similarity = state.similarity_index
+    arrays["similarity.vectors"] = similarity.vectors
+    arrays["similarity.planes"] = similarity.planes
+    arrays["similarity.codes"] = similarity.codes
+    arrays["similarity.order"] = similarity.order
+
+    meta = {
+        "created": time.time(),
+        "layout": STATE_LAYOUT,
+        "rules": rules_fingerprint(),
+        "model_version": state.model_version,
+        "model": {
+            "classes": [str(c) for c in model.classes_],
+            "categories": model.categories,
+            "categorical_features": model.categorical_features,
+            "numeric_features": model.numeric_features
+        },
+        "catalog": {"columns": list(courses.columns), "coded": coded},
+        "rankings": list(state.category_rankings),
+        "paths": [list(key) for key, _ in paths],
+        "sources": {
+            "model": file_fingerprint(model_path),
+            "catalog": file_fingerprint(catalog_path)
+        }
+    }
+    write_bundle(path, arrays, meta)
+
+def state_from_bundle(bundle):
+    meta = bundle.meta
+
+    m = meta["model"]
+    model = LinearModel(
+        bundle["model.coef"], bundle["model.intercept"], m["classes"],
+        m["categories"], m["categorical_features"], m["numeric_features"]
+    )
+
+    # Numeric and id columns stay read-only views into the bundle; string
+    # and coded columns become per-process object arrays (Python strings)
+    columns = {}
+    for column in STRING_COLUMNS:
+        columns[column] = unpack_strings(bundle, f"catalog.{column}")
+    for column, labels in meta["catalog"]["coded"].items():
+        codes = bundle[f"catalog.{column}"]
+        columns[column] = pd.Categorical.from_codes(codes, labels).astype(object)
+    for column in NUMERIC_COLUMNS + ID_COLUMNS:
+        columns[column] = bundle[f"catalog.{column}"]
+    catalog = Catalog(
+        {column: columns[column] for column in meta["catalog"]["columns"]},
+        bundle["catalog.index"]
+    )
+    courses = catalog.frame()
+
+    category_rankings = {c: bundle[f"rankings.{c}"] for c in meta["rankings"]}
+
+    path_ids, path_offsets = bundle["paths.ids"], bundle["paths.offsets"]
+    learning_paths = {
+        tuple(key): path_ids[path_offsets[i]:path_offsets[i + 1]].tolist()
+        for i, key in enumerate(meta["paths"])
+    }
+
+    title_index = TrigramIndex.from_arrays(
+        searchable_titles(courses),
+        unpack_strings(bundle, "trigram.grams"),
+        bundle["trigram.offsets"],
+        bundle["trigram.ids"]
+    )
+
+    similarity_index = SimilarCourseIndex(
+        bundle["similarity.vectors"], bundle["similarity.planes"],
+        bundle["similarity.codes"], bundle["similarity.order"]
+    )
+
+    return AppState(
+        model, catalog, title_index, similarity_index, category_rankings,
+        learning_paths, meta["model_version"], source="bundle"
+    )
+
+def bundle_is_fresh(bundle, model_path=MODEL_PATH, catalog_path=CATALOG_PATH):
+    if bundle.meta.get("layout") != STATE_LAYOUT:
+        return False
+    # Tags, rankings, facets and paths depend on the rules as well
+    if bundle.meta.get("rules") != rules_fingerprint():
+        return False
+    sources = bundle.meta.get("sources", {})
+    try:
+        return (
+            sources.get("model") == file_fingerprint(model_path)
+            and sources.get("catalog") == file_fingerprint(catalog_path)
+        )
+    except OSError:
+        return False
+
+def load_state(bundle_path=BUNDLE_PATH, model_path=MODEL_PATH, catalog_path=CATALOG_PATH):
+    """
+    Opens the state bundle when it is up to date with its sources,
+    otherwise builds the state from the sources.
+    """
+    if os.path.exists(bundle_path):
+        with timed("bundle_open"):
+            try:
+                bundle = Bundle(bundle_path)
+            except ValueError:
+                bundle = None
+            if bundle is not None and bundle_is_fresh(bundle, model_path, catalog_path):
+                return state_from_bundle(bundle)
+    return build_state(model_path, catalog_path)
+
+# =====================================================
+# Derived resources
+# =====================================================
+def explainer_for(model):
+    """
+    The model as a LinearModel, or None when it cannot be exported; such
+    models are served through their own predict_proba, unexplained.
+    """
+    if isinstance(model, LinearModel):
+        return model
+    try:
+        return LinearModel.from_pipeline(model)
+    except ValueError:
+        count("explainer_unsupported")
+        return None
+
+def build_resources(state):
+    """
+    Builds every catalog-derived resource the app serves from state, so a
+    loader can prepare them all before the state is swapped in.
+    """
+    model, courses, rankings = state.model, state.courses, state.category_rankings
+    facets = FacetIndex.from_catalog(courses, rankings)
+    return {
+        "state": state,
+        "version": time.time_ns(),
+        # The bundle already serves a LinearModel; a pickled pipeline is
+        # exported once, or None when it is not a supported linear model
+        "explainer": explainer_for(model),
+        "facets": facets,
+        "course_table": CourseTable(courses, facets),
+        "explorer": BinnedExplorer(*catalog_arrays(courses)),
+        "org_aggregates": OrganizationAggregates.from_catalog(courses, rankings),
+        "dedup_stats": dedup_stats(courses)
+    }
+
+# =====================================================
+# Background loading and refresh
+# =====================================================
+def sources_fingerprint(paths):
+    try:
+        return [file_fingerprint(path) for path in paths]
+    except OSError:
+        return None
+
+class StateLoader:
+    """
+    Loads the app state on a background thread so the page can render its
+    skeleton meanwhile, then keeps it up to date with its source files.
+
+    prepare(state) builds whatever is derived from a state; result() is
+    the prepared value. Every refresh_seconds the loader checks the
+    sources, and once a change has settled (same size and mtime on two
+    checks in a row, so a file still being copied is not read) it loads
+    and prepares a new state off to the side, then replaces the single
+    current reference. Readers that took the old reference keep a
+    complete old version; a failed refresh keeps serving the old one.
+    A failed first load is retried the same way once the sources change
+    and settle; result() raises its error until then.
+    """
+
+    def __init__(self, load=load_state, prepare=None, sources=(MODEL_PATH, CATALOG_PATH),
+                 refresh_seconds=REFRESH_SECONDS):
+        self.current = None
+        self.error = None
+        self.refresh_error = None
+        self.version = 0
+        self.load_seconds = None
+        self.loaded_at = None
+        self.sources = sources
+        self.refresh_seconds = refresh_seconds
+        self._load = load
+        self._prepare = prepare or (lambda state: state)
+        self._done = threading.Event()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="state-loader", daemon=True)
+        self._thread.start()
+
+    def _build(self):
+        start = time.perf_counter()
+        fingerprint = sources_fingerprint(self.sources)
+        prepared = self._prepare(self._load())
+        self.current = prepared
+        self.error = None
+        self.version += 1
+        self.load_seconds = time.perf_counter() - start
+        self.loaded_at = time.time()
+        return fingerprint
+
+    def _run(self):
+        loaded = sources_fingerprint(self.sources)
+        try:
+            loaded = self._build()
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self._done.set()
+
+        # Until a first load succeeds the sources are watched even with
+        # refreshing off, so a file that was mid-copy at startup is retried
+        poll_seconds = self.refresh_seconds if self.refresh_seconds > 0 else RETRY_SECONDS
+        seen = loaded
+        while not self._closed.wait(poll_seconds):
+            if self.current is not None and self.refresh_seconds <= 0:
+                return
+            latest = sources_fingerprint(self.sources)
+            if latest is None or latest == loaded:
+                seen = latest
+                continue
+            if latest != seen:
+                # Changed since the last check; wait for it to settle
+                seen = latest
+                continue
+            first = self.current is None
+            try:
+                with timed("state_load_retry" if first else "state_refresh"):
+                    loaded = self._build()
+                self.refresh_error = None
+                count("state_load_retries" if first else "state_refreshes")
+            except Exception as exc:
+                if first:
+                    self.error = exc
+                else:
+                    self.refresh_error = exc
+                loaded = latest
+
+    def ready(self):
+        return self._done.is_set()
+
+    def result(self, timeout=None):
+        """
+        Waits for the first state (up to timeout seconds) and returns the
+        current one, re-raising any error from the first load.
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError("app state is still loading")
+        if self.error is not None:
+            raise self.error
+        return self.current
+
+    def close(self):
+        self._closed.set()
+
+_loader = None
+_loader_lock = threading.Lock()
+
+def get_state_loader():
+    """
+    Returns the process-wide loader of the app state and its resources,
+    starting it on first call.
+    """
+    global _loader
+    with _loader_lock:
+        if _loader is None:
+            _loader = StateLoader(prepare=build_resources)
+        return _loader
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pack the app state into one mmap-able bundle")
+    parser.add_argument("--model", default=MODEL_PATH)
+    parser.add_argument("--catalog", default=CATALOG_PATH)
+    parser.add_argument("--output", default=BUNDLE_PATH)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    state = build_state(args.model, args.catalog)
+    write_state_bundle(state, args.output, args.model, args.catalog)
+    stats = dedup_stats(state.courses)
+    print(f"📚 {stats['rows']} courses, {stats['canonical']} after deduplication "
+          f"({stats['duplicates']} duplicates in {stats['clusters_with_duplicates']} clusters)")
+    size_mb = os.path.getsize(args.output) / 2**20
+    print(f"✅ State bundle written to {args.output} ({size_mb:.1f} MB) in {time.perf_counter() - start:.1f}s")
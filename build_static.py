@@ -0,0 +1,160 @@
+import html
+import json
+import os
+import re
+import shutil
+import tempfile
+
+from guidance import CAREER_GUIDANCE, GENERAL_ADVICE, career_guidance, skill_gap_advice, content_hash
+
+# =====================================================
+# Settings
+# =====================================================
+# Any plain file server can serve this directory, e.g.
+#   python -m http.server --directory static/guidance
+OUTPUT_DIR = os.path.join("static", "guidance")
+MANIFEST = "manifest.json"
+
+STYLE = """
+body { font-family: sans-serif; max-width: 760px; margin: 2rem auto; padding: 0 1rem; color: #262730; }
+h1 { font-size: 1.8rem; } h2 { font-size: 1.2rem; margin-top: 1.6rem; }
+ul { padding-left: 1.2rem; } .advice { background: #e8f4fd; padding: 0.8rem 1rem; border-radius: 6px; }
+nav a { margin-right: 0.8rem; }
+"""
+
+def slugify(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+# =====================================================
+# Page rendering
+# =====================================================
+def _page(title, body):
+    return (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>{html.escape(title)}</title>\n<style>{STYLE}</style>\n</head>\n"
+        f"<body>\n<nav><a href=\"index.html\">All pages</a></nav>\n{body}\n</body>\n</html>\n"
+    )
+
+def _list(items, marker):
+    return "<ul>" + "".join(f"<li>{marker} {html.escape(i)}</li>" for i in items) + "</ul>"
+
+def render_career_page(career):
+    guide = career_guidance(career)
+    body = (
+        f"<h1>🧭 {html.escape(career)}</h1>"
+        f"<h2>🔍 Role Overview</h2><p>{html.escape(guide['Overview'])}</p>"
+        f"<h2>🧠 Core Skills Required</h2>{_list(guide['Core Skills'], '✔')}"
+        f"<h2>🛠️ Recommended Tools &amp; Technologies</h2>{_list(guide['Tools'], '🔧')}"
+        f"<h2>📈 Typical Career Progression</h2>{_list(guide['Career Path'], '➡️')}"
+    )
+    return _page(f"{career} — Career Roadmap", body)
+
+def render_skill_gap_page(career, level):
+    general, career_specific = skill_gap_advice(career, level)
+    body = (
+        f"<h1>📈 {html.escape(career)} — {html.escape(level)}</h1>"
+        f"<h2>🎯 Learning Focus: {html.escape(general['Focus'])}</h2>"
+        f"<h2>📘 Recommended Learning Actions</h2>{_list(general['Actions'], '•')}"
+        f"<p class=\"advice\">💡 Career-Specific Advice: {html.escape(career_specific)}</p>"
+    )
+    return _page(f"{career} ({level}) — Learning Plan", body)
+
+def render_index(pages):
+    links = "".join(
+        f"<li><a href=\"{html.escape(path)}\">{html.escape(title)}</a></li>"
+        for path, title in pages
+    )
+    return _page("Career Guidance", f"<h1>🎓 Career Guidance</h1><ul>{links}</ul>")
+
+# =====================================================
+# Build
+# =====================================================
+def is_stale(output_dir=OUTPUT_DIR):
+    try:
+        with open(os.path.join(output_dir, MANIFEST)) as f:
+            return json.load(f).get("content_hash") != content_hash()
+    except (OSError, ValueError):
+        return True
+
+def _write_pages(scratch):
+    """
+    Writes every page, the JSON bundle and the manifest into scratch.
+    """
+    pages = []
+    bundle = {"careers": {}, "skill_gap": {}}
+
+    def write(name, text):
+        with open(os.path.join(scratch, name), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    for career in CAREER_GUIDANCE:
+        slug = slugify(career)
+        write(f"career-{slug}.html", render_career_page(career))
+        write(f"career-{slug}.json", json.dumps(career_guidance(career), indent=2))
+        pages.append((f"career-{slug}.html", f"{career} — Career Roadmap"))
+        bundle["careers"][career] = career_guidance(career)
+
+        for level in GENERAL_ADVICE:
+            general, career_specific = skill_gap_advice(career, level)
+            content = {**general, "Career-Specific Advice": career_specific}
+            name = f"skill-gap-{slug}-{slugify(level)}"
+            write(f"{name}.html", render_skill_gap_page(career, level))
+            write(f"{name}.json", json.dumps(content, indent=2))
+            pages.append((f"{name}.html", f"{career} ({level}) — Learning Plan"))
+            bundle["skill_gap"].setdefault(career, {})[level] = content
+
+    write("index.html", render_index(pages))
+    write("guidance.json", json.dumps(bundle, indent=2))
+    write(MANIFEST, json.dumps({
+        "content_hash": content_hash(),
+        "pages": [path for path, _ in pages]
+    }, indent=2))
+
+def build(output_dir=OUTPUT_DIR, force=False):
+    """
+    Renders every career page and every career × skill level page to
+    HTML and JSON. Skips the work when the guidance content is unchanged.
+    Pages are written to a scratch directory first and swapped in, so a
+    file server never sees a half-written set.
+
+    Returns True when pages were (re)built.
+    """
+    if not force and not is_stale(output_dir):
+        return False
+
+    # A scratch directory of our own, next to output_dir so the swap is a
+    # rename: processes building at the same time never share one
+    parent = os.path.dirname(os.path.abspath(output_dir))
+    os.makedirs(parent, exist_ok=True)
+    scratch = tempfile.mkdtemp(prefix=".guidance-", dir=parent)
+    os.chmod(scratch, 0o755)
+    old = scratch + ".old"
+    try:
+        _write_pages(scratch)
+        try:
+            os.replace(output_dir, old)
+        except FileNotFoundError:
+            pass
+        try:
+            os.replace(scratch, output_dir)
+        except OSError:
+            # Another process swapped in the same pages first
+            if not os.path.isdir(output_dir):
+                raise
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+        shutil.rmtree(old, ignore_errors=True)
+    return True
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pre-render the career guidance pages")
+    parser.add_argument("--output", default=OUTPUT_DIR)
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+
+    if build(args.output, force=args.force):
+        print(f"✅ Guidance pages written to {args.output}")
+    else:
+        print("Guidance pages are up to date")
@@ -0,0 +1,203 @@
+import re
+import unicodedata
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+from category_tagger import TAGGER
+
+# =====================================================
+# Settings
+# =====================================================
+CATALOG_PATH = "data/coursea_data.csv"
+
+ENROLLMENT_SUFFIXES = {"k": 1e3, "m": 1e6, "b": 1e9}
+
+# Words that mark a packaging variant of the same course rather than a
+# different course ("Developing Your Musicianship" course vs specialization)
+VARIANT_WORDS = re.compile(r"\b(?:specializations?|specialisations?|professional certificates?)\b")
+
+# =====================================================
+# Loading
+# =====================================================
+def parse_enrollment(values):
+    """
+    Converts enrollment strings like "5.3k" or "1.2m" to numbers (NaN if unparsable).
+    """
+    text = pd.Series(values, dtype="object").astype(str).str.strip().str.lower()
+    suffix = text.str[-1]
+    scale = suffix.map(ENROLLMENT_SUFFIXES).fillna(1.0)
+    digits = text.where(~suffix.isin(list(ENROLLMENT_SUFFIXES)), text.str[:-1])
+    return pd.to_numeric(digits.str.replace(",", ""), errors="coerce") * scale
+
+def load_catalog(path=CATALOG_PATH):
+    """
+    Reads the course CSV, drops index columns and adds a numeric
+    students_enrolled column, the title_key / canonical_id dedup columns
+    and the category_mask column (bitmask of category_tagger categories).
+    """
+    courses = pd.read_csv(path)
+    courses = courses.loc[:, ~courses.columns.str.contains("^Unnamed")]
+    courses["students_enrolled"] = parse_enrollment(courses["course_students_enrolled"]).to_numpy()
+    courses["category_mask"] = TAGGER.tag_all(courses["course_title"])
+    return add_dedup_columns(courses)
+
+# =====================================================
+# Normalization and deduplication
+# =====================================================
+def title_key(text):
+    """
+    Normalized title used to detect duplicates: Unicode-normalized and
+    case-folded, variant words dropped, punctuation and whitespace
+    collapsed. Non-Latin titles keep their letters.
+    """
+    if not isinstance(text, str):
+        return ""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = VARIANT_WORDS.sub(" ", text)
+    return " ".join(re.sub(r"[\W_]+", " ", text).split())
+
+def add_dedup_columns(courses):
+    """
+    Adds title_key and canonical_id. Rows with the same title key from the
+    same organization form one duplicate cluster; its canonical id is the
+    row label of the most enrolled member (first row on ties).
+    """
+    keys = courses["course_title"].map(title_key)
+    organizations = courses["course_organization"].map(title_key)
+    cluster = pd.util.hash_pandas_object(
+        pd.DataFrame({"key": keys, "org": organizations}), index=False
+    ).to_numpy()
+    # Rows without a usable title are never merged
+    cluster = np.where(keys.to_numpy() == "", -np.arange(1, len(keys) + 1), cluster.view(np.int64))
+
+    enrolled = courses["students_enrolled"].fillna(-1.0).to_numpy()
+    order = np.lexsort((np.arange(len(courses)), -enrolled))
+    canonical = pd.Series(courses.index.to_numpy()[order], index=cluster[order])
+    canonical = canonical[~canonical.index.duplicated()]
+
+    courses["title_key"] = keys.to_numpy()
+    courses["canonical_id"] = canonical.reindex(cluster).to_numpy(dtype=np.int64)
+    return courses
+
+def is_canonical(courses):
+    return (courses["canonical_id"].to_numpy() == courses.index.to_numpy())
+
+def dedup_stats(courses):
+    sizes = courses["canonical_id"].value_counts()
+    return {
+        "rows": len(courses),
+        "canonical": len(sizes),
+        "duplicates": int(len(courses) - len(sizes)),
+        "clusters_with_duplicates": int((sizes > 1).sum()),
+        "largest_cluster": int(sizes.max()) if len(sizes) else 0
+    }
+
+def unique_canonical(canonical_ids, positions, exclude=None, limit=None):
+    """
+    Maps row positions to canonical ids, keeping the first occurrence of
+    each and leaving out the cluster of exclude (a row position).
+    """
+    seen = set()
+    if exclude is not None:
+        seen.add(canonical_ids[exclude])
+    unique = []
+    for position in positions:
+        canonical = canonical_ids[position]
+        if canonical in seen:
+            continue
+        seen.add(canonical)
+        unique.append(int(canonical))
+        if limit is not None and len(unique) == limit:
+            break
+    return unique
+
+def searchable_titles(courses):
+    """
+    Titles for the search indexes, blank for non-canonical rows so only
+    one member of each duplicate cluster can be found.
+    """
+    titles = courses["course_title"].fillna("")
+    return titles.where(is_canonical(courses), "").tolist()
+
+# =====================================================
+# Immutable shared catalog
+# =====================================================
+def _frozen(values):
+    """
+    Read-only NumPy array of values. Arrays that are already read-only
+    (e.g. views into the state bundle) are kept as they are; anything
+    else is copied first, so no writable alias of the data survives.
+    """
+    if isinstance(values, pd.Series):
+        values = values.to_numpy(dtype=object if not pd.api.types.is_numeric_dtype(values) else None)
+    if isinstance(values, np.ndarray) and not values.flags.writeable:
+        return values
+    array = np.array(values, copy=True)
+    array.flags.writeable = False
+    return array
+
+class Catalog:
+    """
+    Frozen course catalog shared by every session and thread.
+
+    Columns are read-only NumPy arrays (strings as object arrays), all
+    derived columns are computed before it is built, and the object
+    itself rejects attribute and column assignment. frame() wraps the
+    same arrays in a new DataFrame without copying; writing through it
+    raises, and adding columns to it only changes that frame. So the
+    catalog can be read concurrently with no locks or defensive copies.
+    """
+
+    def __init__(self, columns, index):
+        object.__setattr__(self, "_columns", MappingProxyType(
+            {name: _frozen(values) for name, values in columns.items()}
+        ))
+        object.__setattr__(self, "index", _frozen(np.asarray(index)))
+
+    @classmethod
+    def from_frame(cls, courses):
+        return cls({name: courses[name] for name in courses.columns}, courses.index)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Catalog is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("Catalog is read-only")
+
+    def __setitem__(self, name, value):
+        raise TypeError("Catalog is read-only; add derived columns in load_catalog")
+
+    def __getitem__(self, name):
+        return self._columns[name]
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def columns(self):
+        return list(self._columns)
+
+    def frame(self, columns=None):
+        """
+        Zero-copy DataFrame over the catalog's arrays.
+        """
+        names = self.columns if columns is None else columns
+        return pd.DataFrame(
+            {name: pd.Series(self._columns[name], copy=False,
+                             dtype=object if self._columns[name].dtype == object else None)
+             for name in names},
+            index=pd.Index(self.index, copy=False),
+            copy=False
+        )
+
+def catalog_arrays(courses):
+    """
+    Returns course_rating and log10(students_enrolled) as float64 arrays.
+    """
+    rating = courses["course_rating"].to_numpy(dtype=float)
+    enrolled = courses["students_enrolled"].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_enrolled = np.log10(enrolled)
+    return rating, log_enrolled
@@ -0,0 +1,83 @@
+from functools import lru_cache
+
+import numpy as np
+
+# =====================================================
+# Server-side binning for the rating vs enrollment explorer
+# =====================================================
+class BinnedExplorer:
+    """
+    Aggregates (x, y) points into a fixed number of 2-D bins per viewport.
+
+    A fine base grid of counts is built once over the full extent. Any
+    viewport at least `bins` base cells wide is answered by summing
+    base cells, which costs O(grid) no matter how many courses there are.
+    Deeper zooms fall back to histogramming the raw points inside the
+    viewport. Either way the chart receives a bins × bins matrix, so the
+    payload does not grow with the catalog. Results are cached per
+    viewport, snapped to the base grid.
+    """
+
+    def __init__(self, x, y, base_bins=512, bins=40, cache_size=256):
+        valid = np.isfinite(x) & np.isfinite(y)
+        self.x = np.ascontiguousarray(x[valid])
+        self.y = np.ascontiguousarray(y[valid])
+        self.bins = bins
+        self.base_bins = base_bins
+
+        self.x_range = (float(self.x.min()), float(self.x.max()))
+        self.y_range = (float(self.y.min()), float(self.y.max()))
+        self.x_edges = np.linspace(*self.x_range, base_bins + 1)
+        self.y_edges = np.linspace(*self.y_range, base_bins + 1)
+        self.base, _, _ = np.histogram2d(self.x, self.y, bins=[self.x_edges, self.y_edges])
+
+        self._cached = lru_cache(maxsize=cache_size)(self._aggregate)
+
+    @property
+    def cache_bytes(self):
+        # Each cached viewport holds a bins x bins count matrix and two edge arrays
+        per_entry = (self.bins * self.bins + 2 * (self.bins + 1)) * 8
+        return self._cached.cache_info().currsize * per_entry
+
+    def __len__(self):
+        return len(self.x)
+
+    def snap(self, x_range, y_range):
+        """
+        Returns the base-grid cell spans covering the viewport.
+        """
+        def cells(edges, lo, hi):
+            start = int(np.clip(np.searchsorted(edges, lo, side="right") - 1, 0, self.base_bins - 1))
+            stop = int(np.clip(np.searchsorted(edges, hi, side="left"), start + 1, self.base_bins))
+            return start, stop
+
+        return cells(self.x_edges, *x_range), cells(self.y_edges, *y_range)
+
+    def viewport(self, x_range, y_range):
+        """
+        Returns (counts, x_edges, y_edges) for the viewport; counts has
+        shape (bins_x, bins_y) with at most `bins` bins per axis.
+        """
+        (x0, x1), (y0, y1) = self.snap(x_range, y_range)
+        return self._cached(x0, x1, y0, y1)
+
+    def _aggregate(self, x0, x1, y0, y1):
+        if x1 - x0 >= self.bins and y1 - y0 >= self.bins:
+            x_groups = np.linspace(x0, x1, self.bins + 1).round().astype(int)
+            y_groups = np.linspace(y0, y1, self.bins + 1).round().astype(int)
+            window = self.base[x0:x1, y0:y1]
+            counts = np.add.reduceat(window, x_groups[:-1] - x0, axis=0)
+            counts = np.add.reduceat(counts, y_groups[:-1] - y0, axis=1)
+            return counts, self.x_edges[x_groups], self.y_edges[y_groups]
+
+        x_lo, x_hi = self.x_edges[x0], self.x_edges[x1]
+        y_lo, y_hi = self.y_edges[y0], self.y_edges[y1]
+        inside = (self.x >= x_lo) & (self.x <= x_hi) & (self.y >= y_lo) & (self.y <= y_hi)
+        counts, x_edges, y_edges = np.histogram2d(
+            self.x[inside], self.y[inside],
+            bins=self.bins, range=[[x_lo, x_hi], [y_lo, y_hi]]
+        )
+        return counts, x_edges, y_edges
+
+def bin_centers(edges):
+    return (edges[:-1] + edges[1:]) / 2
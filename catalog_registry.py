@@ -0,0 +1,212 @@
+import glob
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+from app_state import build_resources, build_state
+from instrumentation import count, timed
+
+# =====================================================
+# Settings
+# =====================================================
+# Partner catalogs, one <institution>.csv per partner in the coursea_data.csv schema
+CATALOG_DIR = os.environ.get("SMS_CATALOG_DIR", os.path.join("data", "catalogs"))
+MEMORY_BUDGET_MB = float(os.environ.get("SMS_CATALOG_BUDGET_MB", "512"))
+
+# =====================================================
+# Memory estimate
+# =====================================================
+def deep_sizeof(obj, _seen=None):
+    """
+    Approximate bytes held by obj: NumPy buffers, DataFrames (deep) and
+    everything reachable through containers and instance attributes,
+    each object counted once. Memory mapped arrays count as zero.
+    """
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        if obj.base is not None:
+            # A view: count the array that owns the buffer instead
+            return deep_sizeof(obj.base, seen) if isinstance(obj.base, np.ndarray) else 0
+        size = obj.nbytes
+        if obj.dtype == object:
+            size += sum(deep_sizeof(item, seen) for item in obj.flat)
+        return size
+    if isinstance(obj, pd.DataFrame):
+        # Column by column, so buffers shared with a Catalog count once
+        return sum(deep_sizeof(obj[c].to_numpy(), seen) for c in obj.columns) + deep_sizeof(obj.index, seen)
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return deep_sizeof(obj.to_numpy(), seen)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (dict, MappingProxyType)):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+        size += deep_sizeof(vars(obj), seen)
+    return size
+
+# =====================================================
+# Catalog registry
+# =====================================================
+def load_partner_catalog(path, main_state):
+    # Partners are served by the main catalog's model, already in memory
+    return build_resources(build_state(
+        catalog_path=path, model=main_state.model, model_version=main_state.model_version
+    ))
+
+def cache_bytes(resources):
+    """
+    Bytes currently held by the result caches of resources (every
+    resource exposing cache_bytes), which grow after loading.
+    """
+    return sum(getattr(r, "cache_bytes", 0) for r in resources.values())
+
+class CatalogRegistry:
+    """
+    Lazily loaded catalogs (each with its derived indexes) under a memory
+    budget.
+
+    get(name, main_state) loads a catalog on first request, served by
+    main_state's model, and keeps it resident until that model changes.
+    A catalog's size is its deep size measured once after loading plus
+    its caches' current size, re-read on every access. When the resident
+    catalogs go over budget_bytes, the least recently used ones are
+    evicted until they fit again; the catalog just requested is never
+    evicted, even if it alone is over budget. Concurrent requests for the
+    same catalog share one load, and loading one catalog does not block
+    requests for others.
+    """
+
+    def __init__(self, sources, budget_bytes=MEMORY_BUDGET_MB * 2**20, load=load_partner_catalog):
+        self.sources = dict(sources)
+        self.budget_bytes = budget_bytes
+        self._load = load
+        self._resident = OrderedDict()
+        self._loading = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            name: {"hits": 0, "misses": 0, "loads": 0, "evictions": 0,
+                   "load_seconds": None, "size_mb": None}
+            for name in self.sources
+        }
+
+    @classmethod
+    def from_directory(cls, directory=CATALOG_DIR, **kwargs):
+        paths = sorted(glob.glob(os.path.join(directory, "*.csv")))
+        return cls({os.path.splitext(os.path.basename(p))[0]: p for p in paths}, **kwargs)
+
+    @property
+    def names(self):
+        return list(self.sources)
+
+    def _size(self, name):
+        resources, size, _ = self._resident[name]
+        return size + cache_bytes(resources)
+
+    def resident(self):
+        """
+        Returns {name: resources} of the resident catalogs.
+        """
+        with self._lock:
+            return {name: resources for name, (resources, _, _) in self._resident.items()}
+
+    def resident_bytes(self):
+        with self._lock:
+            return sum(self._size(name) for name in self._resident)
+
+    def get(self, name, main_state):
+        """
+        Returns the resources of catalog name, loading it if needed.
+        """
+        while True:
+            with self._lock:
+                stats = self.stats[name]
+                resident = self._resident.get(name)
+                if resident is not None and resident[2] != main_state.model_version:
+                    # Built around a model that has since been replaced
+                    del self._resident[name]
+                    resident = None
+                if resident is not None:
+                    self._resident.move_to_end(name)
+                    stats["hits"] += 1
+                    count("catalog_hits")
+                    # Its caches may have grown since the last access
+                    self._evict(keep=name)
+                    return resident[0]
+                loading = self._loading.get(name)
+                if loading is None:
+                    stats["misses"] += 1
+                    count("catalog_misses")
+                    loading = self._loading[name] = threading.Event()
+                    break
+            # Another thread is loading it; wait and look again
+            loading.wait()
+
+        try:
+            start = time.perf_counter()
+            with timed("catalog_load_partner"):
+                resources = self._load(self.sources[name], main_state)
+            # Caches are not walked by deep_sizeof; they are added on access
+            size = deep_sizeof(resources)
+            with self._lock:
+                stats["loads"] += 1
+                stats["load_seconds"] = round(time.perf_counter() - start, 3)
+                self._resident[name] = (resources, size, main_state.model_version)
+                self._evict(keep=name)
+            return resources
+        finally:
+            with self._lock:
+                self._loading.pop(name).set()
+
+    def _evict(self, keep):
+        sizes = {name: self._size(name) for name in self._resident}
+        for name, size in sizes.items():
+            self.stats[name]["size_mb"] = round(size / 2**20, 2)
+        total = sum(sizes.values())
+        for name in list(self._resident):
+            if total <= self.budget_bytes:
+                break
+            if name == keep:
+                continue
+            del self._resident[name]
+            total -= sizes[name]
+            self.stats[name]["evictions"] += 1
+            count("catalog_evictions")
+
+    def summary(self):
+        with self._lock:
+            rows = []
+            for name, stats in self.stats.items():
+                requests = stats["hits"] + stats["misses"]
+                rows.append({
+                    "catalog": name,
+                    "resident": name in self._resident,
+                    **stats,
+                    "hit_rate": stats["hits"] / requests if requests else float("nan")
+                })
+            return rows
+
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_catalog_registry():
+    """
+    Returns the process-wide registry of partner catalogs found in
+    CATALOG_DIR (possibly empty).
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = CatalogRegistry.from_directory()
+        return _registry
@@ -0,0 +1,104 @@
+from collections import deque
+
+import numpy as np
+
+# =====================================================
+# Keyword rules
+# =====================================================
+# Case-insensitive substrings; a title gets every category with a match.
+CATEGORY_RULES = {
+    "Data": ["data", "analytics"],
+    "Programming": ["python", "program", "software"],
+    "Business": ["business", "management"]
+}
+
+# =====================================================
+# Aho-Corasick automaton
+# =====================================================
+class KeywordTagger:
+    """
+    All keyword rules compiled into one Aho-Corasick automaton.
+
+    Tagging walks each title once, character by character, whatever the
+    number of keywords, and returns a bitmask with bit i set for the i-th
+    category that matched.
+    """
+
+    def __init__(self, rules=CATEGORY_RULES):
+        self.categories = list(rules)
+        self.bits = {category: 1 << i for i, category in enumerate(self.categories)}
+
+        # State 0 is the root; goto[state] maps a character to the next state
+        self.goto = [{}]
+        self.output = [0]
+        for category, keywords in rules.items():
+            for keyword in keywords:
+                state = 0
+                for char in keyword.casefold():
+                    if char not in self.goto[state]:
+                        self.goto.append({})
+                        self.output.append(0)
+                        self.goto[state][char] = len(self.goto) - 1
+                    state = self.goto[state][char]
+                self.output[state] |= self.bits[category]
+
+        # Breadth-first failure links; outputs of the fallback state are
+        # merged in so a match never needs to follow the chain
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.output[child] |= self.output[self.fail[child]]
+                queue.append(child)
+
+        # Resolve failure links ahead of time into a full transition table
+        # over the keyword alphabet (breadth-first, so fail states come
+        # first); any other character goes back to the root
+        self.delta = [dict(self.goto[0])] + [None] * (len(self.goto) - 1)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            row = dict(self.delta[self.fail[state]])
+            row.update(self.goto[state])
+            self.delta[state] = row
+            queue.extend(self.goto[state].values())
+
+    def tag(self, text):
+        if not isinstance(text, str):
+            return 0
+        delta, output = self.delta, self.output
+        state = mask = 0
+        for char in text.casefold():
+            state = delta[state].get(char, 0)
+            mask |= output[state]
+        return mask
+
+    def tag_all(self, texts):
+        return np.fromiter((self.tag(t) for t in texts), dtype=np.int64)
+
+    def names(self, mask):
+        return [c for c in self.categories if mask & self.bits[c]]
+
+TAGGER = KeywordTagger()
+
+# =====================================================
+# Catalog helpers
+# =====================================================
+def has_category(courses, category, tagger=TAGGER):
+    """
+    Boolean mask of the rows tagged with category.
+    """
+    return (courses["category_mask"].to_numpy() & tagger.bits[category]) != 0
+
+def category_counts(courses, tagger=TAGGER):
+    """
+    Number of courses per category (a course counts once in each of its
+    categories).
+    """
+    return {category: int(has_category(courses, category, tagger).sum()) for category in tagger.categories}
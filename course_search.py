@@ -0,0 +1,150 @@
+import re
+from collections import defaultdict
+
+import numpy as np
+
+# =====================================================
+# Title normalization
+# =====================================================
+def normalize_title(text):
+    """
+    Lower-cases a title and collapses punctuation and whitespace to single spaces.
+    """
+    text = re.sub(r"[^a-z0-9]+", " ", str(text).lower())
+    return text.strip()
+
+def title_tokens(text):
+    return normalize_title(text).split()
+
+def token_trigrams(token):
+    """
+    Returns the character trigrams of a single token, padded so that
+    the first and last letters get their own grams.
+    """
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def edit_distance(a, b):
+    """
+    Levenshtein distance between two strings (two-row dynamic programming).
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != cb)
+            ))
+        previous = current
+    return previous[-1]
+
+# =====================================================
+# Trigram Index
+# =====================================================
+class TrigramIndex:
+    """
+    Typo-tolerant lookup over course titles.
+
+    The index is built once: every title token is split into character
+    trigrams and each trigram keeps a posting array of the titles that
+    contain it. A query only touches the postings of its own trigrams to
+    pick candidates, and only those candidates are re-ranked by edit
+    distance, so lookups do not turn into a scan of the whole catalog.
+    """
+
+    def __init__(self, titles, postings=None):
+        self.titles = titles if postings is not None else list(titles)
+        self._tokens = {}
+
+        if postings is None:
+            grams = defaultdict(set)
+            for doc_id in range(len(self.titles)):
+                for token in self._title_tokens(doc_id):
+                    for gram in token_trigrams(token):
+                        grams[gram].add(doc_id)
+            postings = {
+                gram: np.fromiter(sorted(ids), dtype=np.int32, count=len(ids))
+                for gram, ids in grams.items()
+            }
+        self._postings = postings
+
+    def __len__(self):
+        return len(self.titles)
+
+    def _title_tokens(self, doc_id):
+        if doc_id not in self._tokens:
+            self._tokens[doc_id] = title_tokens(self.titles[doc_id])
+        return self._tokens[doc_id]
+
+    def to_arrays(self):
+        """
+        Returns the postings as (grams, offsets, ids) for storing in a bundle.
+        """
+        grams = sorted(self._postings)
+        offsets = np.zeros(len(grams) + 1, dtype=np.int64)
+        np.cumsum([len(self._postings[g]) for g in grams], out=offsets[1:])
+        ids = np.concatenate([self._postings[g] for g in grams]) if grams else np.empty(0, np.int32)
+        return grams, offsets, ids.astype(np.int32)
+
+    @classmethod
+    def from_arrays(cls, titles, grams, offsets, ids):
+        """
+        Rebuilds the index around stored postings; slices of ids are used
+        as-is, without copying.
+        """
+        postings = {g: ids[offsets[i]:offsets[i + 1]] for i, g in enumerate(grams)}
+        return cls(titles, postings=postings)
+
+    def candidates(self, query, max_candidates=50):
+        """
+        Returns title ids ordered by how many query trigrams they share.
+        """
+        grams = set()
+        for token in title_tokens(query):
+            grams |= token_trigrams(token)
+
+        hits = [self._postings[g] for g in grams if g in self._postings]
+        if not hits:
+            return np.empty(0, dtype=np.int32)
+
+        ids, counts = np.unique(np.concatenate(hits), return_counts=True)
+        if len(ids) > max_candidates:
+            keep = np.argpartition(-counts, max_candidates - 1)[:max_candidates]
+            ids, counts = ids[keep], counts[keep]
+        return ids[np.argsort(-counts, kind="stable")]
+
+    def _distance(self, query_tokens, doc_id):
+        # Each query token is matched to its closest title token, so a short
+        # query like "pyhton" is not penalized for the rest of a long title.
+        doc_tokens = self._title_tokens(doc_id)
+        if not doc_tokens:
+            return None
+
+        total = 0
+        for token in query_tokens:
+            best = min(edit_distance(token, d) for d in doc_tokens)
+            if best > max(1, len(token) // 3):
+                return None
+            total += best
+        return total
+
+    def search(self, query, top_n=5, max_candidates=50):
+        """
+        Returns up to top_n (title_id, distance) pairs, closest first.
+        """
+        query_tokens = title_tokens(query)
+        if not query_tokens:
+            return []
+
+        scored = []
+        for rank, doc_id in enumerate(self.candidates(query, max_candidates)):
+            distance = self._distance(query_tokens, int(doc_id))
+            if distance is not None:
+                scored.append((distance, rank, int(doc_id)))
+
+        scored.sort()
+        return [(doc_id, distance) for distance, _, doc_id in scored[:top_n]]
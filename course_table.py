@@ -0,0 +1,103 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# =====================================================
+# Settings
+# =====================================================
+DIFFICULTY_ORDER = {"Beginner": 0, "Intermediate": 1, "Mixed": 2, "Advanced": 3}
+
+SORT_COLUMNS = {
+    "Rating": "course_rating",
+    "Enrollment": "students_enrolled",
+    "Difficulty": "course_difficulty"
+}
+
+TABLE_COLUMNS = [
+    "course_title",
+    "course_organization",
+    "course_rating",
+    "course_difficulty",
+    "course_students_enrolled"
+]
+
+# =====================================================
+# Paginated course table
+# =====================================================
+class CourseTable:
+    """
+    Server-side sorted, filtered and paginated view of the catalog.
+
+    One stable sort permutation per (column, direction) is computed at
+    build time. The first request for a facet selection keeps the
+    permutation entries whose bit is set in the FacetIndex bitset, once,
+    and caches the result. After that, each page is a slice of that
+    array, and only the rows on the page are read from the catalog.
+
+    The cache keeps the cache_size most recently used selections;
+    cache_bytes is the memory their position arrays take.
+    """
+
+    def __init__(self, courses, facets, cache_size=128):
+        self.courses = courses
+        self.facets = facets
+
+        self.permutations = {}
+        for label, column in SORT_COLUMNS.items():
+            if column == "course_difficulty":
+                values = courses[column].map(DIFFICULTY_ORDER).to_numpy(dtype=float)
+            else:
+                values = courses[column].to_numpy(dtype=float)
+            # NaN sorts last in both directions
+            missing = np.isnan(values)
+            filled = np.where(missing, 0.0, values)
+            self.permutations[(label, False)] = np.lexsort((filled, missing))
+            self.permutations[(label, True)] = np.lexsort((-filled, missing))
+
+        self.cache_size = cache_size
+        self.cache_bytes = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _ordered(self, selection_key, sort_by, descending):
+        key = (selection_key, sort_by, descending)
+        with self._lock:
+            positions = self._cache.get(key)
+            if positions is not None:
+                self._cache.move_to_end(key)
+                return positions
+
+        perm = self.permutations[(sort_by, descending)]
+        keep = self.facets.mask(dict(selection_key))
+        positions = perm[keep[perm]]
+
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = positions
+                self.cache_bytes += positions.nbytes
+                while len(self._cache) > self.cache_size:
+                    _, dropped = self._cache.popitem(last=False)
+                    self.cache_bytes -= dropped.nbytes
+        return positions
+
+    def count(self, selection=None, sort_by="Rating", descending=True):
+        return len(self._ordered(selection_key(selection), sort_by, descending))
+
+    def page(self, page=1, page_size=10, selection=None, sort_by="Rating", descending=True):
+        """
+        Returns (rows, total) where rows holds the TABLE_COLUMNS of the
+        page_size courses on the given 1-based page.
+        """
+        positions = self._ordered(selection_key(selection), sort_by, descending)
+        start = (page - 1) * page_size
+        rows = self.courses.iloc[positions[start:start + page_size]][TABLE_COLUMNS]
+        return rows, len(positions)
+
+def selection_key(selection):
+    """
+    Hashable, order-independent form of a facet selection.
+    """
+    return tuple(sorted(
+        (facet, tuple(sorted(values))) for facet, values in (selection or {}).items() if values
+    ))
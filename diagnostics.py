@@ -0,0 +1,149 @@
+import pandas as pd
+import streamlit as st
+
+import instrumentation
+from app_state import get_state_loader
+from catalog_registry import get_catalog_registry
+from event_log import get_event_log
+from memory_profile import get_tracker
+from shadow_model import SHADOW_MODEL_PATH, get_shadow, shadow_error
+
+STARTUP_STAGES = ("time_to_first_paint", "time_to_interactive")
+
+# =====================================================
+# Hidden diagnostics page (open the app with ?diagnostics=1)
+# =====================================================
+def diagnostics_requested():
+    return st.query_params.get("diagnostics") == "1"
+
+def render_diagnostics():
+    st.title("🩺 Diagnostics")
+
+    if not instrumentation.ENABLED:
+        st.warning("Metrics are disabled. Start the app with SMS_METRICS=1 to collect them.")
+
+    rows = instrumentation.REGISTRY.summary()
+    startup = [r for r in rows if r["stage"] in STARTUP_STAGES]
+    rows = [r for r in rows if r["stage"] not in STARTUP_STAGES]
+    if startup:
+        st.markdown("### 🚀 Startup")
+        st.caption("Per new session: first paint is when the page skeleton and static tabs are on screen, interactive is when the model and catalog are ready.")
+        st.dataframe(pd.DataFrame(startup).set_index("stage"), use_container_width=True)
+
+    if rows:
+        st.markdown("### ⏱️ Stage Timings")
+        st.dataframe(pd.DataFrame(rows).set_index("stage"), use_container_width=True)
+    elif not startup:
+        st.info("No timings recorded yet.")
+
+    counters = instrumentation.REGISTRY.counters
+    if counters:
+        st.markdown("### 🔢 Event Counters")
+        st.table(pd.Series(counters, name="count"))
+
+    render_catalog()
+    render_catalog_registry()
+    render_shadow()
+    render_memory()
+    render_event_log()
+
+    st.markdown("### 💾 Export")
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Save metrics.prom", key="dump_prom"):
+            instrumentation.REGISTRY.dump("metrics.prom")
+            st.success("Saved metrics.prom")
+    with col2:
+        if st.button("Save metrics.json", key="dump_json"):
+            instrumentation.REGISTRY.dump("metrics.json")
+            st.success("Saved metrics.json")
+
+    if st.button("Reset metrics", key="reset_metrics"):
+        instrumentation.REGISTRY.reset()
+        st.rerun()
+
+def catalog_dedup_stats():
+    """
+    Deduplication stats of the catalogs currently served: the main one
+    (as of its latest refresh) and the resident partner catalogs.
+    """
+    stats = {}
+    main = get_state_loader().current
+    if main is not None:
+        stats["Coursera"] = main["dedup_stats"]
+    stats.update({
+        name: resources["dedup_stats"]
+        for name, resources in get_catalog_registry().resident().items()
+    })
+    return stats
+
+def render_catalog():
+    st.markdown("### 📚 Catalog Deduplication")
+    stats = catalog_dedup_stats()
+    if not stats:
+        st.info("The catalog is still loading.")
+        return
+    st.table(pd.DataFrame(stats).T)
+
+def render_catalog_registry():
+    registry = get_catalog_registry()
+    if not registry.names:
+        return
+    st.markdown("### 🏛️ Partner Catalogs")
+    st.write(
+        f"Resident: {registry.resident_bytes() / 2**20:.1f} MB "
+        f"of a {registry.budget_bytes / 2**20:.0f} MB budget"
+    )
+    st.dataframe(pd.DataFrame(registry.summary()).set_index("catalog"), use_container_width=True)
+
+def render_shadow():
+    st.markdown("### 🌓 Shadow Model")
+    if not SHADOW_MODEL_PATH:
+        st.info("Shadow mode is off. Start the app with SMS_SHADOW_MODEL=<candidate .pkl> to enable it.")
+        return
+    shadow = get_shadow()
+    if shadow is None:
+        if shadow_error() is not None:
+            st.error(f"Could not load {SHADOW_MODEL_PATH}: {shadow_error()}")
+        else:
+            st.info(f"Loading {SHADOW_MODEL_PATH}…")
+        return
+    summary = {k: f"{v:.3f}" if isinstance(v, float) else str(v) for k, v in shadow.summary().items()}
+    st.table(pd.Series(summary, name="shadow"))
+
+def render_memory():
+    st.markdown("### 🧠 Memory")
+    tracker = get_tracker()
+    if tracker is None:
+        st.info("Memory profiling is off. Start the app with SMS_MEMPROFILE=N to snapshot every N reruns.")
+        return
+
+    sessions = tracker.session_summary()
+    if sessions:
+        st.markdown("**RSS per session (MB)**")
+        if tracker.sessions_dropped:
+            st.caption(f"{tracker.sessions_dropped} less recently active sessions no longer tracked.")
+        st.dataframe(pd.DataFrame(sessions).set_index("session"), use_container_width=True)
+
+    if not tracker.reports:
+        st.info(f"No snapshot yet (one is taken every {tracker.snapshot_every} reruns).")
+        return
+
+    latest = tracker.reports[-1]
+    st.write(
+        f"Rerun {latest['rerun']}: RSS {latest['rss_mb']:.1f} MB, "
+        f"traced {latest['traced_mb']:.1f} MB (peak {latest['peak_traced_mb']:.1f} MB)"
+    )
+    if latest["top_growth"]:
+        st.markdown("**Top growing allocation sites since the previous snapshot**")
+        st.dataframe(pd.DataFrame(latest["top_growth"]), use_container_width=True)
+
+def render_event_log():
+    st.markdown("### 📝 Event Log")
+    log = get_event_log()
+    st.table(pd.Series({
+        "written": log.written,
+        "dropped": log.dropped,
+        "pending": log.pending(),
+        "rotations": log.rotations
+    }, name="events"))
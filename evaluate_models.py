@@ -0,0 +1,140 @@
+import os
+import tempfile
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import StratifiedKFold, cross_val_score
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from student_data import generate_students, build_pipeline, FEATURES, TARGET
+
+# =====================================================
+# Settings
+# =====================================================
+# generate_students seed of the holdout; the training data uses 42
+HOLDOUT_SEED = 7
+
+# =====================================================
+# Candidate pipelines
+# =====================================================
+# Every candidate must support predict_proba, which the app relies on.
+def candidate_pipelines():
+    return {
+        "logistic_regression": build_pipeline(LogisticRegression(max_iter=1000)),
+        "decision_tree": build_pipeline(DecisionTreeClassifier(random_state=42)),
+        "random_forest": build_pipeline(RandomForestClassifier(n_estimators=100, random_state=42)),
+        "gradient_boosting": build_pipeline(GradientBoostingClassifier(random_state=42)),
+        "knn": build_pipeline(KNeighborsClassifier(n_neighbors=15))
+    }
+
+# =====================================================
+# Measurements
+# =====================================================
+def median_seconds(fn, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+def inference_costs(model, X, batch_size, repeats):
+    single = X.iloc[[0]]
+    batch = X.sample(batch_size, replace=True, random_state=0)
+    single_s = median_seconds(lambda: model.predict_proba(single), repeats)
+    batch_s = median_seconds(lambda: model.predict_proba(batch), max(1, repeats // 5))
+    return {
+        "single_row_ms": 1000 * single_s,
+        f"batch_{batch_size}_ms": 1000 * batch_s,
+        "per_row_us_in_batch": 1e6 * batch_s / batch_size
+    }
+
+def artifact_costs(path, repeats):
+    return {
+        "artifact_kb": os.path.getsize(path) / 1024,
+        "load_ms": 1000 * median_seconds(lambda: joblib.load(path), max(1, repeats // 5))
+    }
+
+def evaluate(name, pipeline, X, y, X_holdout, y_holdout, folds=5, batch_size=1000, repeats=50):
+    """
+    Cross-validates a pipeline, then fits it on all of X, scores it on the
+    holdout and measures inference latency, artifact size and load time.
+    """
+    cv = StratifiedKFold(n_splits=folds, shuffle=True, random_state=42)
+    scores = cross_val_score(clone(pipeline), X, y, cv=cv, scoring="accuracy")
+
+    model = clone(pipeline).fit(X, y)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"{name}.pkl")
+        joblib.dump(model, path)
+        artifact = artifact_costs(path, repeats)
+
+    return {
+        "model": name,
+        "cv_accuracy": scores.mean(),
+        "cv_std": scores.std(),
+        "holdout_accuracy": model.score(X_holdout, y_holdout),
+        **inference_costs(model, X, batch_size, repeats),
+        **artifact
+    }
+
+def evaluate_saved(path, X_holdout, y_holdout, batch_size=1000, repeats=50):
+    """
+    Scores a saved model as it is, without refitting, on the holdout and
+    measures its inference latency and the size and load time of the file
+    itself.
+    """
+    model = joblib.load(path)
+    return {
+        "model": os.path.basename(path),
+        "cv_accuracy": float("nan"),
+        "cv_std": float("nan"),
+        "holdout_accuracy": model.score(X_holdout, y_holdout),
+        **inference_costs(model, X_holdout, batch_size, repeats),
+        **artifact_costs(path, repeats)
+    }
+
+def compare(pipelines, X, y, X_holdout, y_holdout, saved=(), folds=5, **kwargs):
+    """
+    Table of the candidate pipelines (fitted on X) and the saved model
+    files (as they are), all scored on the same holdout.
+    """
+    rows = [evaluate(name, p, X, y, X_holdout, y_holdout, folds=folds, **kwargs)
+            for name, p in pipelines.items()]
+    rows += [evaluate_saved(path, X_holdout, y_holdout, **kwargs) for path in saved]
+    return pd.DataFrame(rows).set_index("model").sort_values("holdout_accuracy", ascending=False)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Compare candidate models on accuracy and inference cost"
+    )
+    parser.add_argument("models", nargs="*", help="saved .pkl models to score as they are")
+    parser.add_argument("--students", type=int, default=400)
+    parser.add_argument("--holdout", type=int, default=400, help="held-out students every model is scored on")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--output", help="also write the table to this CSV file")
+    args = parser.parse_args()
+
+    students = generate_students(n=args.students, seed=42)
+    X, y = students[FEATURES], students[TARGET]
+    # A different seed: none of these students were used for training
+    holdout = generate_students(n=args.holdout, seed=HOLDOUT_SEED)
+
+    table = compare(
+        candidate_pipelines(), X, y, holdout[FEATURES], holdout[TARGET],
+        saved=args.models, folds=args.folds, batch_size=args.batch_size
+    )
+    print(table.to_string(float_format="{:.3f}".format))
+
+    if args.output:
+        table.to_csv(args.output)
+        print(f"✅ Comparison saved as {args.output}")
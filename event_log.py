@@ -0,0 +1,138 @@
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+
+# =====================================================
+# Settings
+# =====================================================
+EVENT_LOG_DIR = os.environ.get("SMS_EVENT_LOG_DIR", "logs")
+
+# =====================================================
+# Event Log
+# =====================================================
+class EventLog:
+    """
+    Append-only, line-delimited JSON log written by a background thread.
+
+    emit() only puts the event on a bounded in-memory queue and never
+    touches the disk, so the UI never waits on I/O. If the writer falls
+    behind (slow disk), new events are dropped and counted instead of
+    growing memory.
+
+    Each process appends to its own active file, events-<pid>.jsonl, so
+    processes sharing the directory never write into each other's files.
+    Once it passes max_bytes it is moved to
+    events-<pid>-<timestamp>-<n>.jsonl without overwriting any existing
+    file, and rotated files are never rewritten.
+    """
+
+    def __init__(self, directory=EVENT_LOG_DIR, max_bytes=10 * 2**20,
+                 max_queue=10_000, batch_size=500, flush_interval=1.0):
+        self.directory = directory
+        self.path = os.path.join(directory, f"events-{os.getpid()}.jsonl")
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.written = 0
+        self.dropped = 0
+        self.rotations = 0
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._closed = threading.Event()
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "ab")
+
+        self._thread = threading.Thread(target=self._run, name="event-log-writer", daemon=True)
+        self._thread.start()
+
+    def emit(self, event_type, **fields):
+        if self._closed.is_set():
+            return False
+        event = {"ts": time.time(), "event": event_type, **fields}
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def close(self, timeout=5.0):
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._thread.join(timeout)
+
+    # -------------------------------
+    # Writer thread
+    # -------------------------------
+    def _run(self):
+        while not (self._closed.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if batch:
+                self._write(batch)
+        self._file.close()
+
+    def _next_batch(self):
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        data = b"".join(
+            json.dumps(e, separators=(",", ":"), default=str).encode("utf-8") + b"\n"
+            for e in batch
+        )
+        self._file.write(data)
+        self._file.flush()
+        self.written += len(batch)
+
+        if self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        self._file.close()
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        prefix = os.path.join(self.directory, f"events-{os.getpid()}-{stamp}")
+        n = 0
+        while True:
+            # link() fails instead of replacing an existing file
+            try:
+                os.link(self.path, f"{prefix}-{n}.jsonl")
+                break
+            except FileExistsError:
+                n += 1
+        os.remove(self.path)
+        self.rotations += 1
+        self._file = open(self.path, "ab")
+
+_event_log = None
+_event_log_lock = threading.Lock()
+
+def get_event_log():
+    """
+    Returns the process-wide event log, starting its writer on first use.
+    """
+    global _event_log
+    with _event_log_lock:
+        if _event_log is None:
+            _event_log = EventLog()
+            atexit.register(_event_log.close)
+        return _event_log
+
+def read_events(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
@@ -0,0 +1,114 @@
+import numpy as np
+
+from catalog import is_canonical
+
+# =====================================================
+# Settings
+# =====================================================
+RATING_BANDS = [
+    ("4.5 and up", 4.5, np.inf),
+    ("4.0 – 4.5", 4.0, 4.5),
+    ("Below 4.0", -np.inf, 4.0)
+]
+UNRATED = "Unrated"
+
+# Set bits per byte value
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+def pack(mask):
+    return np.packbits(np.asarray(mask, dtype=bool))
+
+def popcount(bits):
+    return int(POPCOUNT[bits].sum(dtype=np.int64))
+
+# =====================================================
+# Bitmap facet index
+# =====================================================
+class FacetIndex:
+    """
+    One packed bitset (np.packbits, 1 bit per catalog row) per facet value.
+
+    A selection maps facet -> chosen values. Values of one facet are OR-ed,
+    facets are AND-ed, so filtering touches n/8 bytes per chosen value
+    instead of re-scanning catalog columns. Facet counts are disjunctive:
+    each option is counted against the selection of the other facets, so
+    it shows how many rows picking it would add.
+    """
+
+    def __init__(self, n, facets, base=None):
+        self.n = n
+        self.bitmaps = {
+            facet: {value: pack(mask) for value, mask in values.items()}
+            for facet, values in facets.items()
+        }
+        self.all = pack(np.ones(n, dtype=bool) if base is None else base)
+
+    @classmethod
+    def from_catalog(cls, courses, category_ids):
+        """
+        Builds Category, Difficulty, Certificate and Rating facets over the
+        canonical rows of courses.
+        """
+        n = len(courses)
+
+        categories = {}
+        for category, ids in category_ids.items():
+            mask = np.zeros(n, dtype=bool)
+            mask[courses.index.get_indexer(ids)] = True
+            categories[category] = mask
+
+        def by_value(column):
+            values = courses[column]
+            return {
+                str(value): (values == value).to_numpy()
+                for value in sorted(values.dropna().unique(), key=str)
+            }
+
+        rating = courses["course_rating"].to_numpy(dtype=float)
+        bands = {label: (rating >= low) & (rating < high) for label, low, high in RATING_BANDS}
+        unrated = np.isnan(rating)
+        if unrated.any():
+            bands[UNRATED] = unrated
+
+        return cls(n, {
+            "Category": categories,
+            "Difficulty": by_value("course_difficulty"),
+            "Certificate": by_value("course_Certificate_type"),
+            "Rating": bands
+        }, base=is_canonical(courses))
+
+    def options(self, facet):
+        return list(self.bitmaps[facet])
+
+    def facet_bits(self, facet, values):
+        bits = np.zeros_like(self.all)
+        for value in values:
+            bits |= self.bitmaps[facet][value]
+        return bits
+
+    def bits(self, selection, skip=None):
+        """
+        Returns the packed bitset of rows matching selection, ignoring the
+        facet named skip. Facets with no chosen values do not filter.
+        """
+        bits = self.all.copy()
+        for facet, values in selection.items():
+            if values and facet != skip:
+                bits &= self.facet_bits(facet, values)
+        return bits
+
+    def mask(self, selection):
+        return np.unpackbits(self.bits(selection), count=self.n).astype(bool)
+
+    def count(self, selection):
+        return popcount(self.bits(selection))
+
+    def counts(self, selection):
+        """
+        Returns {facet: {value: count}} for every option of every facet.
+        """
+        counts = {}
+        for facet, values in self.bitmaps.items():
+            others = self.bits(selection, skip=facet)
+            counts[facet] = {value: popcount(others & bits) for value, bits in values.items()}
+        return counts
@@ -0,0 +1,95 @@
+import hashlib
+import json
+
+# =====================================================
+# Career Path Guidance
+# =====================================================
+CAREER_GUIDANCE = {
+    "Data Analyst": {
+        "Overview": "Analyze structured data to support operational and strategic decisions.",
+        "Core Skills": ["Statistics and probability", "SQL and Python", "Data visualization"],
+        "Tools": ["Excel", "SQL", "Python", "Power BI"],
+        "Career Path": ["Junior Data Analyst", "Senior Data Analyst", "Data Scientist"]
+    },
+    "Data Scientist": {
+        "Overview": "Develop predictive models and advanced analytics solutions.",
+        "Core Skills": ["Machine learning", "Advanced statistics", "Big data processing"],
+        "Tools": ["Python", "R", "TensorFlow", "Spark"],
+        "Career Path": ["Data Scientist", "Senior Data Scientist", "AI Engineer"]
+    },
+    "Software Engineer": {
+        "Overview": "Design, build, and maintain scalable software systems.",
+        "Core Skills": ["Algorithms and data structures", "System design", "Software testing"],
+        "Tools": ["Python", "Java", "Git", "Docker"],
+        "Career Path": ["Junior Software Engineer", "Senior Software Engineer", "Technical Lead"]
+    },
+    "AI / ML Engineer": {
+        "Overview": "Deploy and optimize AI and machine learning systems.",
+        "Core Skills": ["Deep learning", "Model optimization", "MLOps"],
+        "Tools": ["PyTorch", "TensorFlow", "MLflow"],
+        "Career Path": ["ML Engineer", "AI Engineer", "AI Architect"]
+    },
+    "Business Analyst": {
+        "Overview": "Translate business problems into data-driven solutions.",
+        "Core Skills": ["Business analysis", "Decision modeling", "Communication"],
+        "Tools": ["Excel", "SQL", "Power BI"],
+        "Career Path": ["Business Analyst", "Senior BA", "Product Manager"]
+    },
+    "Cybersecurity Analyst": {
+        "Overview": "Protect systems and data from cyber threats.",
+        "Core Skills": ["Network security", "Risk assessment", "Incident response"],
+        "Tools": ["Wireshark", "Metasploit", "SIEM tools"],
+        "Career Path": ["Security Analyst", "Security Engineer", "Security Architect"]
+    },
+    "Product Manager": {
+        "Overview": "Define product vision and coordinate cross-functional teams.",
+        "Core Skills": ["Product strategy", "User research", "Stakeholder management"],
+        "Tools": ["JIRA", "Figma", "Analytics tools"],
+        "Career Path": ["Associate PM", "Product Manager", "Senior PM"]
+    }
+}
+
+# =====================================================
+# Skill Gap & Study Advice
+# =====================================================
+GENERAL_ADVICE = {
+    "Beginner": {
+        "Focus": "Build strong fundamentals",
+        "Actions": ["Take introductory courses", "Practice basic exercises", "Learn core tools"]
+    },
+    "Intermediate": {
+        "Focus": "Apply knowledge practically",
+        "Actions": ["Complete hands-on projects", "Work with real datasets", "Participate in internships"]
+    },
+    "Advanced": {
+        "Focus": "Specialize and master skills",
+        "Actions": ["Advanced coursework", "Research papers", "Capstone projects"]
+    }
+}
+
+CAREER_ADVICE = {
+    "Data Analyst": "Focus on dashboards and business reporting.",
+    "Data Scientist": "Improve model tuning and feature engineering.",
+    "Software Engineer": "Practice system design and scalability.",
+    "AI / ML Engineer": "Deploy and optimize ML pipelines.",
+    "Business Analyst": "Strengthen decision analysis and communication.",
+    "Cybersecurity Analyst": "Practice penetration testing and monitoring.",
+    "Product Manager": "Work on product case studies and roadmaps."
+}
+
+def career_guidance(career):
+    return CAREER_GUIDANCE[career]
+
+def skill_gap_advice(career, level):
+    return GENERAL_ADVICE[level], CAREER_ADVICE[career]
+
+def content_hash():
+    """
+    Fingerprint of all guidance content, used to tell when the
+    pre-rendered pages are out of date.
+    """
+    payload = json.dumps(
+        [CAREER_GUIDANCE, GENERAL_ADVICE, CAREER_ADVICE],
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
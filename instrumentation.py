@@ -0,0 +1,183 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+# =====================================================
+# Settings
+# =====================================================
+# Timers are no-ops unless SMS_METRICS=1 (or enable() is called), so the
+# instrumented code paths cost one global lookup when metrics are off.
+ENABLED = os.environ.get("SMS_METRICS", "0") == "1"
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def enable(flag=True):
+    global ENABLED
+    ENABLED = flag
+
+# =====================================================
+# Histogram & Registry
+# =====================================================
+class Histogram:
+    """
+    Fixed-bucket latency histogram (seconds), Prometheus style.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def quantile(self, q):
+        """
+        Returns the upper bound of the bucket holding the q-th quantile.
+        """
+        if self.count == 0:
+            return None
+        target = q * self.count
+        running = 0
+        for bound, n in zip(BUCKETS + (float("inf"),), self.counts):
+            running += n
+            if running >= target:
+                return bound
+        return float("inf")
+
+class Registry:
+    """
+    In-process store of stage histograms and event counters.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {}
+        self.counters = {}
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            if stage not in self.histograms:
+                self.histograms[stage] = Histogram()
+            self.histograms[stage].observe(seconds)
+
+    def increment(self, event, n=1):
+        with self._lock:
+            self.counters[event] = self.counters.get(event, 0) + n
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    def summary(self):
+        """
+        Returns one row per stage with count, mean and approximate p50/p95 (ms).
+        """
+        with self._lock:
+            rows = []
+            for stage, h in sorted(self.histograms.items()):
+                rows.append({
+                    "stage": stage,
+                    "count": h.count,
+                    "mean_ms": 1000 * h.sum / h.count,
+                    "p50_ms": 1000 * h.quantile(0.5),
+                    "p95_ms": 1000 * h.quantile(0.95)
+                })
+            return rows
+
+    def to_json(self):
+        with self._lock:
+            return json.dumps({
+                "buckets": list(BUCKETS),
+                "stages": {
+                    stage: {"counts": h.counts, "sum": h.sum, "count": h.count}
+                    for stage, h in self.histograms.items()
+                },
+                "counters": dict(self.counters)
+            }, indent=2)
+
+    def to_prometheus(self):
+        with self._lock:
+            lines = [
+                "# HELP sms_stage_seconds Time spent in each app stage.",
+                "# TYPE sms_stage_seconds histogram"
+            ]
+            for stage, h in sorted(self.histograms.items()):
+                running = 0
+                for bound, n in zip(BUCKETS, h.counts):
+                    running += n
+                    lines.append(f'sms_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {running}')
+                lines.append(f'sms_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {h.count}')
+                lines.append(f'sms_stage_seconds_sum{{stage="{stage}"}} {h.sum}')
+                lines.append(f'sms_stage_seconds_count{{stage="{stage}"}} {h.count}')
+
+            lines += [
+                "# HELP sms_events_total App events.",
+                "# TYPE sms_events_total counter"
+            ]
+            for event, n in sorted(self.counters.items()):
+                lines.append(f'sms_events_total{{event="{event}"}} {n}')
+            return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        """
+        Writes the metrics to path; .json files get JSON, anything else
+        the Prometheus text format.
+        """
+        text = self.to_json() if path.endswith(".json") else self.to_prometheus()
+        with open(path, "w") as f:
+            f.write(text)
+
+REGISTRY = Registry()
+
+# =====================================================
+# Timers
+# =====================================================
+class _Timer:
+    def __init__(self, stage):
+        self.stage = stage
+        self.start = time.perf_counter()
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def stop(self):
+        REGISTRY.observe(self.stage, time.perf_counter() - self.start)
+
+class _NoopTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def stop(self):
+        pass
+
+_NOOP = _NoopTimer()
+
+def timed(stage):
+    """
+    Times a stage, either as a context manager or via timed(...).stop().
+    """
+    if not ENABLED:
+        return _NOOP
+    return _Timer(stage)
+
+def observe(stage, seconds):
+    if ENABLED:
+        REGISTRY.observe(stage, seconds)
+
+def count(event, n=1):
+    if ENABLED:
+        REGISTRY.increment(event, n)
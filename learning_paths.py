@@ -0,0 +1,121 @@
+import numpy as np
+
+from catalog import is_canonical
+from category_tagger import has_category
+from guidance import CAREER_GUIDANCE
+
+# =====================================================
+# Settings
+# =====================================================
+LEVELS = ["Beginner", "Intermediate", "Advanced"]
+
+CAREER_CATEGORIES = {
+    "Data Analyst": "Data",
+    "Data Scientist": "Data",
+    "AI / ML Engineer": "Data",
+    "Software Engineer": "Programming",
+    "Cybersecurity Analyst": "Programming",
+    "Business Analyst": "Business",
+    "Product Manager": "Business"
+}
+
+PATH_STEPS = 4
+
+def course_scores(courses):
+    """
+    rating x log10(1 + students enrolled); unrated courses score 0.
+    """
+    rating = np.nan_to_num(courses["course_rating"].to_numpy(dtype=float))
+    enrolled = np.nan_to_num(courses["students_enrolled"].to_numpy(dtype=float))
+    return rating * np.log10(1 + enrolled)
+
+# =====================================================
+# Course DAG and dynamic programming
+# =====================================================
+def prefix_max(values):
+    """
+    For each position, the max of values strictly before it and the first
+    position holding that max (-inf and 0 at the start).
+    """
+    running = np.maximum.accumulate(values)
+    rises = np.concatenate(([True], running[1:] > running[:-1]))
+    at = np.maximum.accumulate(np.where(rises, np.arange(len(values)), 0))
+    return np.concatenate(([-np.inf], running[:-1])), np.concatenate(([0], at[:-1]))
+
+def best_path(levels, scores, start_level, steps=PATH_STEPS):
+    """
+    Best path through a difficulty DAG. levels are level numbers (0..2)
+    and scores node weights, both already in topological order
+    (level, then best score first).
+
+    A path starts at start_level and each next course is later in the
+    order and at the same or the next level, so levels are never skipped
+    and never go down. Among paths of the greatest length up to steps,
+    the one reaching the highest level wins, then the highest total
+    score. Returns node positions in path order.
+
+    A node's best predecessor is the best earlier node at its own level or
+    the level below, so each step keeps one running prefix maximum per
+    level: O(n * steps) time and O(n) memory.
+    """
+    n = len(levels)
+    if n == 0:
+        return []
+    order = np.arange(n)
+    # One row per level plus a trailing -inf row, which levels - 1 = -1 picks
+    rows = np.arange(levels.max() + 1)[:, None] == levels[None, :]
+
+    best = np.where(levels == start_level, scores, -np.inf)
+    tables, parents = [best], []
+    for _ in range(steps - 1):
+        maxima, at = zip(*(prefix_max(np.where(row, tables[-1], -np.inf)) for row in rows))
+        maxima = np.vstack(maxima + (np.full(n, -np.inf),))
+        at = np.vstack(at + (np.zeros(n, dtype=np.int64),))
+
+        same, same_at = maxima[levels, order], at[levels, order]
+        below, below_at = maxima[levels - 1, order], at[levels - 1, order]
+        # Ties go to the earlier node
+        from_below = (below > same) | ((below == same) & (below_at < same_at))
+        parent = np.where(from_below, below_at, same_at)
+        best = scores + np.maximum(same, below)
+        if not np.isfinite(best).any():
+            break
+        tables.append(best)
+        parents.append(parent)
+
+    best = tables[-1]
+    finite = np.flatnonzero(np.isfinite(best))
+    if len(finite) == 0:
+        return []
+    end = finite[np.lexsort((-best[finite], -levels[finite]))[0]]
+
+    path = [int(end)]
+    for parent in reversed(parents):
+        path.append(int(parent[path[-1]]))
+    return path[::-1]
+
+def build_learning_paths(courses, steps=PATH_STEPS):
+    """
+    Returns {(career, level): [course ids]} for every career in
+    CAREER_GUIDANCE and every current level, computed once per category
+    over its canonical, levelled courses.
+    """
+    rank = {level: i for i, level in enumerate(LEVELS)}
+    levelled = courses[is_canonical(courses) & courses["course_difficulty"].isin(LEVELS).to_numpy()]
+
+    by_category = {}
+    for category in set(CAREER_CATEGORIES.values()):
+        members = levelled[has_category(levelled, category)]
+        levels = members["course_difficulty"].map(rank).to_numpy()
+        scores = course_scores(members)
+        order = np.lexsort((-scores, levels))
+        ids = members.index.to_numpy()[order]
+        for start, level in enumerate(LEVELS):
+            path = best_path(levels[order], scores[order], start, steps)
+            by_category[(category, level)] = [int(i) for i in ids[path]]
+
+    return {
+        (career, level): by_category[(CAREER_CATEGORIES[career], level)]
+        for career in CAREER_GUIDANCE
+        for level in LEVELS
+    }
@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import OneHotEncoder
+
+# =====================================================
+# Exported logistic regression
+# =====================================================
+def is_one_vs_rest(clf):
+    """
+    Whether clf's predict_proba normalizes per-class sigmoids (the rule
+    scikit-learn's LogisticRegression.predict_proba applies).
+    """
+    multi_class = getattr(clf, "multi_class", "auto")
+    return multi_class in ("ovr", "warn") or (
+        multi_class in ("auto", "deprecated")
+        and (len(clf.classes_) <= 2 or clf.solver == "liblinear")
+    )
+
+class LinearModel:
+    """
+    The course model's parameters as plain arrays.
+
+    Reproduces predict_proba of the one-hot + passthrough
+    LogisticRegression pipeline without unpickling scikit-learn objects,
+    so it can be stored in, and served from, the state bundle.
+    """
+
+    def __init__(self, coef, intercept, classes, categories, categorical_features, numeric_features):
+        self.coef_ = coef
+        self.intercept_ = intercept
+        self.classes_ = np.asarray(classes, dtype=object)
+        self.categories = categories
+        self.categorical_features = categorical_features
+        self.numeric_features = numeric_features
+
+        self.feature_names = [
+            f"cat__{feature}_{value}"
+            for feature in categorical_features
+            for value in categories[feature]
+        ] + [f"num__{feature}" for feature in numeric_features]
+
+        # Encoded columns of each input feature are contiguous; these are
+        # the first column of each block, for np.add.reduceat
+        self.input_features = list(categorical_features) + list(numeric_features)
+        widths = [len(categories[f]) for f in categorical_features] + [1] * len(numeric_features)
+        self._feature_starts = np.concatenate([[0], np.cumsum(widths)[:-1]]).astype(int)
+
+    @classmethod
+    def from_pipeline(cls, pipeline):
+        """
+        Exports a fitted one-hot + LogisticRegression pipeline. Raises
+        ValueError for any other model, including a LogisticRegression
+        whose predict_proba is not the softmax (multinomial multiclass) or
+        sigmoid (binary) this class reproduces.
+        """
+        try:
+            preprocess = pipeline.named_steps["preprocess"]
+            clf = pipeline.named_steps["classifier"]
+            encoder = preprocess.named_transformers_["cat"]
+        except (AttributeError, KeyError, TypeError):
+            raise ValueError("not a fitted preprocess + classifier pipeline") from None
+        if not isinstance(clf, LogisticRegression) or not isinstance(encoder, OneHotEncoder):
+            raise ValueError(f"cannot export a {type(clf).__name__} pipeline, only LogisticRegression")
+        if is_one_vs_rest(clf) != (len(clf.classes_) <= 2):
+            raise ValueError(
+                "only multinomial multiclass (or plain binary) LogisticRegression "
+                "probabilities can be reproduced"
+            )
+
+        categorical, numeric = [], []
+        for name, _, columns in preprocess.transformers_:
+            if name == "cat":
+                categorical = list(columns)
+            elif name == "num":
+                numeric = list(columns)
+
+        categories = {f: [str(v) for v in cats] for f, cats in zip(categorical, encoder.categories_)}
+        return cls(clf.coef_, clf.intercept_, clf.classes_, categories, categorical, numeric)
+
+    def encode(self, X):
+        """
+        One-hot encodes a DataFrame of profiles (unknown values are all-zero).
+        """
+        blocks = []
+        for feature in self.categorical_features:
+            labels = self.categories[feature]
+            codes = pd.Index(labels).get_indexer(X[feature].astype(str))
+            onehot = np.zeros((len(X), len(labels)))
+            known = codes >= 0
+            onehot[np.flatnonzero(known), codes[known]] = 1.0
+            blocks.append(onehot)
+        for feature in self.numeric_features:
+            blocks.append(X[feature].to_numpy(dtype=float)[:, None])
+        return np.hstack(blocks)
+
+    def decision_function(self, X):
+        return self.encode(X) @ self.coef_.T + self.intercept_
+
+    def predict_proba(self, X):
+        return self._proba(self.decision_function(X))
+
+    @staticmethod
+    def _proba(scores):
+        if scores.shape[1] == 1:
+            positive = 1 / (1 + np.exp(-scores[:, 0]))
+            return np.column_stack([1 - positive, positive])
+        scores = scores - scores.max(axis=1, keepdims=True)
+        exp = np.exp(scores)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+    def explain(self, X, class_index=None):
+        """
+        Scores X and explains each row with one encode pass.
+
+        Returns (probabilities, contributions): contributions[i, j] is
+        coefficient x encoded value summed over the columns of
+        input_features[j], toward class_index (default: each row's predicted
+        class). They add up, with the intercept, to that class's score.
+        Works on whole cohorts at once.
+        """
+        encoded = self.encode(X)
+        probabilities = self._proba(encoded @ self.coef_.T + self.intercept_)
+        if class_index is None:
+            class_index = probabilities.argmax(axis=1)
+        class_index = np.broadcast_to(class_index, (len(encoded),))
+
+        if self.coef_.shape[0] == 1:
+            # Binary: the single row of coefficients scores the positive class
+            sign = np.where(class_index == 1, 1.0, -1.0)
+            weights = self.coef_[0] * sign[:, None]
+        else:
+            weights = self.coef_[class_index]
+
+        contributions = np.add.reduceat(encoded * weights, self._feature_starts, axis=1)
+        return probabilities, contributions
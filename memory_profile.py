@@ -0,0 +1,132 @@
+import os
+import resource
+import threading
+import tracemalloc
+from collections import OrderedDict, deque
+
+# =====================================================
+# Settings
+# =====================================================
+# SMS_MEMPROFILE=N turns memory tracking on and takes a tracemalloc
+# snapshot every N reruns. It is off by default because tracemalloc slows
+# every allocation down.
+SNAPSHOT_EVERY = int(os.environ.get("SMS_MEMPROFILE", "0"))
+
+def current_rss_mb():
+    """
+    Resident set size of this process in MB (peak RSS where /proc is missing).
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+# =====================================================
+# Memory Tracker
+# =====================================================
+class MemoryTracker:
+    """
+    Diffs tracemalloc snapshots every snapshot_every reruns and records
+    the RSS seen by each session.
+
+    Per session it keeps a rerun count and the first, last and max RSS,
+    for the keep_sessions most recently active sessions only (least
+    recently active ones are dropped), so the tracker's own memory stays
+    bounded however many sessions come and go.
+    """
+
+    def __init__(self, snapshot_every, top_n=10, keep_reports=20, keep_sessions=100):
+        self.snapshot_every = snapshot_every
+        self.top_n = top_n
+        self.reruns = 0
+        self.reports = deque(maxlen=keep_reports)
+        self.session_rss = OrderedDict()
+        self.sessions_dropped = 0
+        self._keep_sessions = keep_sessions
+        self._previous = None
+        self._lock = threading.Lock()
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def on_rerun(self, session_id):
+        with self._lock:
+            self.reruns += 1
+            rerun = self.reruns
+            rss = current_rss_mb()
+            session = self.session_rss.get(session_id)
+            if session is None:
+                # reruns, first, last and max RSS
+                session = self.session_rss[session_id] = [0, rss, rss, rss]
+                if len(self.session_rss) > self._keep_sessions:
+                    self.session_rss.popitem(last=False)
+                    self.sessions_dropped += 1
+            else:
+                self.session_rss.move_to_end(session_id)
+            session[0] += 1
+            session[2] = rss
+            session[3] = max(session[3], rss)
+
+            if rerun % self.snapshot_every == 0:
+                self._snapshot(rerun)
+
+    def _snapshot(self, rerun):
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")
+        ])
+
+        growth = []
+        if self._previous is not None:
+            stats = snapshot.compare_to(self._previous, "lineno")
+            for stat in stats[:self.top_n]:
+                if stat.size_diff <= 0:
+                    continue
+                frame = stat.traceback[0]
+                growth.append({
+                    "site": f"{frame.filename}:{frame.lineno}",
+                    "size_diff_kb": stat.size_diff / 1024,
+                    "count_diff": stat.count_diff
+                })
+
+        traced, peak = tracemalloc.get_traced_memory()
+        self.reports.append({
+            "rerun": rerun,
+            "rss_mb": current_rss_mb(),
+            "traced_mb": traced / 2**20,
+            "peak_traced_mb": peak / 2**20,
+            "top_growth": growth
+        })
+        self._previous = snapshot
+
+    def session_summary(self):
+        """
+        Returns first/last/max RSS (MB) and rerun count per tracked
+        session, most recently active last.
+        """
+        with self._lock:
+            return [{
+                "session": session_id[:8],
+                "reruns": reruns,
+                "first_rss_mb": first,
+                "last_rss_mb": last,
+                "max_rss_mb": peak,
+                "growth_mb": last - first
+            } for session_id, (reruns, first, last, peak) in self.session_rss.items()]
+
+_tracker = None
+_tracker_lock = threading.Lock()
+
+def get_tracker():
+    """
+    Returns the process-wide tracker, or None when profiling is off.
+    """
+    global _tracker
+    if SNAPSHOT_EVERY <= 0:
+        return None
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = MemoryTracker(SNAPSHOT_EVERY)
+        return _tracker
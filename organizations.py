@@ -0,0 +1,136 @@
+import math
+
+from catalog import is_canonical
+from recommendations import DEFAULT_CATEGORY
+
+# =====================================================
+# Settings
+# =====================================================
+# Bayesian rating = (PRIOR_WEIGHT * mean rating + sum of ratings)
+#                   / (PRIOR_WEIGHT + rated courses)
+# so an organization with one 5.0 course does not beat one with twenty 4.8s.
+PRIOR_WEIGHT = 5
+
+# =====================================================
+# Per-organization aggregates
+# =====================================================
+class OrganizationAggregates:
+    """
+    Materialized category -> organization view of the catalog: course
+    count, rating sum, rated course count and total enrollment.
+
+    The view is updated one course at a time by add()/remove()/update(),
+    never re-grouped. The best organization of each category is cached and
+    recomputed, over that category's organizations only, on the first
+    lookup after a change.
+    """
+
+    def __init__(self):
+        self.groups = {}
+        self.courses = {}
+        self.rating_sum = 0.0
+        self.rated = 0
+        self._best = {}
+
+    @classmethod
+    def from_catalog(cls, courses, category_ids):
+        """
+        Builds the view from the canonical catalog rows listed in
+        category_ids (category -> row ids).
+        """
+        aggregates = cls()
+        canonical = is_canonical(courses)
+        categories = {}
+        for category, ids in category_ids.items():
+            for course_id in ids:
+                categories.setdefault(int(course_id), []).append(category)
+
+        columns = courses[["course_organization", "course_rating", "students_enrolled"]]
+        rows = zip(canonical, columns.itertuples())
+        for keep, (course_id, organization, rating, enrolled) in rows:
+            if keep and course_id in categories:
+                aggregates.add(course_id, organization, rating, enrolled, categories[course_id])
+        return aggregates
+
+    # -------------------------------------------------
+    # Incremental maintenance
+    # -------------------------------------------------
+    def add(self, course_id, organization, rating, enrolled, categories):
+        if course_id in self.courses:
+            raise KeyError(f"course {course_id} is already aggregated")
+        if not isinstance(organization, str):
+            return
+        rating = None if rating is None or math.isnan(rating) else float(rating)
+        enrolled = 0.0 if enrolled is None or math.isnan(enrolled) else float(enrolled)
+        self.courses[course_id] = (organization, rating, enrolled, tuple(categories))
+        self._apply(organization, rating, enrolled, categories, sign=1)
+
+    def remove(self, course_id):
+        organization, rating, enrolled, categories = self.courses.pop(course_id)
+        self._apply(organization, rating, enrolled, categories, sign=-1)
+
+    def update(self, course_id, organization, rating, enrolled, categories):
+        if course_id in self.courses:
+            self.remove(course_id)
+        self.add(course_id, organization, rating, enrolled, categories)
+
+    def _apply(self, organization, rating, enrolled, categories, sign):
+        rated = rating is not None
+        if rated:
+            self.rating_sum += sign * rating
+            self.rated += sign
+            # The prior mean moved, so every category's best may change
+            self._best.clear()
+
+        for category in categories:
+            organizations = self.groups.setdefault(category, {})
+            group = organizations.setdefault(organization, [0, 0.0, 0, 0.0])
+            group[0] += sign
+            group[1] += sign * (rating if rated else 0.0)
+            group[2] += sign * rated
+            group[3] += sign * enrolled
+            if group[0] == 0:
+                del organizations[organization]
+            self._best.pop(category, None)
+
+    # -------------------------------------------------
+    # Lookups
+    # -------------------------------------------------
+    @property
+    def mean_rating(self):
+        return self.rating_sum / self.rated if self.rated else 0.0
+
+    def stats(self, category, organization):
+        count, rating_sum, rated, enrolled = self.groups[category][organization]
+        prior = self.mean_rating
+        return {
+            "organization": organization,
+            "courses": count,
+            "mean_rating": rating_sum / rated if rated else float("nan"),
+            "bayesian_rating": (PRIOR_WEIGHT * prior + rating_sum) / (PRIOR_WEIGHT + rated),
+            "students_enrolled": enrolled
+        }
+
+    def best(self, category):
+        """
+        Returns the stats of the organization with the highest Bayesian
+        rating in category (most enrolled on ties), or None.
+        """
+        if category not in self._best:
+            candidates = [
+                self.stats(category, organization)
+                for organization in self.groups.get(category, ())
+            ]
+            self._best[category] = max(
+                candidates,
+                key=lambda s: (s["bayesian_rating"], s["students_enrolled"]),
+                default=None
+            )
+        return self._best[category]
+
+def suggest_university(aggregates, course_type):
+    """
+    Returns the stats of the best organization for course_type, falling
+    back to DEFAULT_CATEGORY.
+    """
+    return aggregates.best(course_type) or aggregates.best(DEFAULT_CATEGORY)
@@ -0,0 +1,68 @@
+import numpy as np
+
+from catalog import is_canonical
+from category_tagger import TAGGER, has_category
+
+# =====================================================
+# Category rankings
+# =====================================================
+DEFAULT_CATEGORY = "Business"
+
+def build_category_rankings(courses):
+    """
+    Returns, for each category, the catalog row ids of its courses
+    ranked best rated first, from the category_mask column tagged at
+    ingestion. Only canonical rows are ranked, so duplicates are never
+    suggested.
+    """
+    valid = courses[is_canonical(courses)].dropna(subset=["course_title", "course_organization"])
+    rankings = {}
+    for category in TAGGER.categories:
+        matches = valid[has_category(valid, category)]
+        ranked = matches.sort_values("course_rating", ascending=False, kind="stable")
+        rankings[category] = ranked.index.to_numpy()
+    return rankings
+
+def ranked_courses(rankings, course_type):
+    return rankings.get(course_type, rankings[DEFAULT_CATEGORY])
+
+# =====================================================
+# Probability-weighted blending
+# =====================================================
+def allocate_slots(probabilities, top_n):
+    """
+    Splits top_n slots across categories in proportion to their
+    probabilities (largest remainder method).
+    """
+    probabilities = np.asarray(probabilities, dtype=float)
+    share = probabilities / probabilities.sum() * top_n
+    slots = np.floor(share).astype(int)
+    remainder = top_n - slots.sum()
+    if remainder > 0:
+        slots[np.argsort(-(share - slots), kind="stable")[:remainder]] += 1
+    return slots
+
+def blend_recommendations(rankings, classes, probabilities, top_n=3, top_k=2):
+    """
+    Mixes the ranked course lists of the top_k most likely categories.
+
+    Returns a list of (course_id, category) pairs, highest probability
+    category first. A course matching several categories is only listed once.
+    """
+    order = np.argsort(-np.asarray(probabilities), kind="stable")[:top_k]
+    slots = allocate_slots(np.asarray(probabilities)[order], top_n)
+
+    picked = []
+    seen = set()
+    for class_idx, n_slots in zip(order, slots):
+        category = classes[class_idx]
+        taken = 0
+        for course_id in ranked_courses(rankings, category):
+            if taken == n_slots:
+                break
+            if course_id in seen:
+                continue
+            seen.add(course_id)
+            picked.append((int(course_id), category))
+            taken += 1
+    return picked
@@ -0,0 +1,165 @@
+import glob
+import json
+import os
+import re
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import OneHotEncoder
+
+from student_data import build_pipeline, CATEGORICAL_FEATURES, FEATURES, TARGET
+
+# =====================================================
+# Versioned artifacts
+# =====================================================
+def next_version_path(base="course_model"):
+    """
+    Returns course_model_v<N>.pkl for the first unused N.
+    """
+    versions = [
+        int(m.group(1))
+        for path in glob.glob(f"{base}_v*.pkl")
+        if (m := re.search(r"_v(\d+)\.pkl$", path))
+    ]
+    return f"{base}_v{max(versions, default=0) + 1}.pkl"
+
+# =====================================================
+# Warm start
+# =====================================================
+def extended_categories(encoder, data):
+    """
+    Returns the encoder's categories with any unseen values in data added.
+    """
+    return [
+        sorted(set(cats) | set(data[feature].dropna().unique()))
+        for feature, cats in zip(CATEGORICAL_FEATURES, encoder.categories_)
+    ]
+
+def warm_start_pipeline(old_model, data):
+    """
+    Builds an unfitted pipeline whose classifier starts from old_model's
+    coefficients, with one-hot vocabularies extended to cover data.
+    Classes are the ones present in data (that is what fit will see).
+    Coefficients are carried over by feature and class name, and new
+    columns or classes start at zero.
+    """
+    old_preprocess = old_model.named_steps["preprocess"]
+    old_clf = old_model.named_steps["classifier"]
+    old_encoder = old_preprocess.named_transformers_["cat"]
+
+    clf = clone(old_clf).set_params(warm_start=True)
+    model = build_pipeline(clf)
+    model.set_params(preprocess__cat=OneHotEncoder(
+        categories=extended_categories(old_encoder, data),
+        handle_unknown="ignore"
+    ))
+    model.named_steps["preprocess"].fit(data[FEATURES])
+
+    classes = np.unique(data[TARGET])
+    features = model.named_steps["preprocess"].get_feature_names_out()
+
+    # Binary models keep a single coefficient row, so only carry
+    # coefficients over when both models are multiclass.
+    if len(classes) > 2 and len(old_clf.classes_) > 2:
+        old_features = {f: i for i, f in enumerate(old_preprocess.get_feature_names_out())}
+        old_classes = {c: i for i, c in enumerate(old_clf.classes_)}
+
+        coef = np.zeros((len(classes), len(features)))
+        intercept = np.zeros(len(classes))
+        for row, c in enumerate(classes):
+            if c not in old_classes:
+                continue
+            intercept[row] = old_clf.intercept_[old_classes[c]]
+            for col, f in enumerate(features):
+                if f in old_features:
+                    coef[row, col] = old_clf.coef_[old_classes[c], old_features[f]]
+
+        clf.coef_ = coef
+        clf.intercept_ = intercept
+    return model
+
+def fit_classifier(model, X, y):
+    """
+    Fits only the classifier step, keeping the preprocess step as built.
+    """
+    encoded = model.named_steps["preprocess"].transform(X)
+    model.named_steps["classifier"].fit(encoded, y)
+    return model
+
+def retrain(old_model, new_data, test_size=0.2, compare_full=False, seed=42):
+    """
+    Warm-starts a new model on new_data and reports timing and accuracy.
+    """
+    stratify = new_data[TARGET] if new_data[TARGET].value_counts().min() >= 2 else None
+    train, test = train_test_split(
+        new_data, test_size=test_size, random_state=seed, stratify=stratify
+    )
+
+    start = time.perf_counter()
+    model = warm_start_pipeline(old_model, train)
+    fit_classifier(model, train[FEATURES], train[TARGET])
+    warm_seconds = time.perf_counter() - start
+
+    report = {
+        "rows": len(train),
+        "warm_start_seconds": warm_seconds,
+        "warm_start_iterations": int(np.max(model.named_steps["classifier"].n_iter_)),
+        "accuracy_before": float(old_model.score(test[FEATURES], test[TARGET])),
+        "accuracy_after": float(model.score(test[FEATURES], test[TARGET]))
+    }
+
+    if compare_full:
+        old_clf = old_model.named_steps["classifier"]
+        start = time.perf_counter()
+        full = warm_start_pipeline(old_model, train)
+        full.steps[-1] = ("classifier", LogisticRegression(**{
+            **old_clf.get_params(), "warm_start": False
+        }))
+        fit_classifier(full, train[FEATURES], train[TARGET])
+        report["full_retrain_seconds"] = time.perf_counter() - start
+        report["full_retrain_iterations"] = int(np.max(full.named_steps["classifier"].n_iter_))
+        report["full_retrain_accuracy"] = float(full.score(test[FEATURES], test[TARGET]))
+
+    return model, report
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Warm-start course_model.pkl on newly collected student data"
+    )
+    parser.add_argument("data", nargs="+", help="CSV files with profile and outcome columns")
+    parser.add_argument("--model", default="course_model.pkl")
+    parser.add_argument("--compare-full", action="store_true",
+                        help="also time a from-scratch retrain on the same data")
+    parser.add_argument("--promote", action="store_true",
+                        help="copy the new version over --model when accuracy does not drop")
+    args = parser.parse_args()
+
+    old_model = joblib.load(args.model)
+    new_data = pd.concat([pd.read_csv(p) for p in args.data], ignore_index=True)
+    new_data = new_data.dropna(subset=FEATURES + [TARGET])
+
+    model, report = retrain(old_model, new_data, compare_full=args.compare_full)
+    report["parent"] = args.model
+
+    path = next_version_path()
+    joblib.dump(model, path)
+    with open(os.path.splitext(path)[0] + ".json", "w") as f:
+        json.dump(report, f, indent=2)
+
+    for key, value in report.items():
+        print(f"{key}: {value}")
+    print(f"✅ Model retrained and saved as {path}")
+
+    if args.promote:
+        if report["accuracy_after"] >= report["accuracy_before"]:
+            joblib.dump(model, args.model)
+            print(f"✅ Promoted {path} to {args.model}")
+        else:
+            print("⚠️ Accuracy dropped, not promoting")
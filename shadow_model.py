@@ -0,0 +1,215 @@
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import joblib
+import numpy as np
+
+from event_log import get_event_log
+from instrumentation import count, timed
+from linear_model import LinearModel
+
+# =====================================================
+# Settings
+# =====================================================
+# Path of the candidate model (e.g. course_model_v2.pkl); shadow mode is off when unset
+SHADOW_MODEL_PATH = os.environ.get("SMS_SHADOW_MODEL", "")
+# Fraction of one core the shadow workers may use on average
+CPU_BUDGET = float(os.environ.get("SMS_SHADOW_CPU", "0.25"))
+
+# =====================================================
+# Shadow evaluation
+# =====================================================
+def candidate_scorer(model):
+    """
+    The candidate as a LinearModel when it is a pipeline of the live
+    model's shape, so both are scored (and timed) through explain();
+    otherwise the model itself.
+    """
+    if isinstance(model, LinearModel):
+        return model
+    try:
+        return LinearModel.from_pipeline(model)
+    except ValueError:
+        return model
+
+class ShadowEvaluator:
+    """
+    Scores live requests with a candidate model on a background thread pool.
+
+    A LinearModel candidate is scored with explain(), the call the live
+    model's latency is measured on, so latency deltas compare like with
+    like; any other candidate falls back to predict() (see "scored via").
+
+    submit() never waits: it hands the request to the pool and returns. The
+    workers' CPU time is metered by a token bucket that refills at
+    cpu_budget CPU-seconds per wall-clock second (up to burst seconds).
+    Admitting a request reserves the average CPU cost seen so far, and the
+    reservation is settled against the measured cost when it finishes.
+    While the bucket is empty, or max_pending requests are already queued,
+    new requests are skipped and counted, so the shadow can never use more
+    than its share of the CPU.
+    """
+
+    def __init__(self, candidate, version, workers=1, cpu_budget=CPU_BUDGET,
+                 burst=1.0, max_pending=100, history=10_000):
+        self.candidate = candidate
+        self.version = version
+        self.cpu_budget = cpu_budget
+        self.burst = burst
+        self.max_pending = max_pending
+        self.same_path = isinstance(candidate, LinearModel)
+
+        self.submitted = 0
+        self.scored = 0
+        self.agreed = 0
+        self.skipped_busy = 0
+        self.skipped_cpu = 0
+        self.failed = 0
+        self.cpu_seconds = 0.0
+        self.latency_deltas = deque(maxlen=history)
+
+        self._tokens = burst
+        self._refilled = time.monotonic()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="shadow")
+
+    def _take_slot(self):
+        """
+        Returns the CPU seconds reserved for a new request, or None if it
+        must be skipped.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.cpu_budget)
+            self._refilled = now
+            if self._pending >= self.max_pending:
+                self.skipped_busy += 1
+                return None
+            if self._tokens <= 0:
+                self.skipped_cpu += 1
+                return None
+            finished = self.scored + self.failed
+            reserved = self.cpu_seconds / finished if finished else 0.01
+            self._tokens -= reserved
+            self._pending += 1
+            return reserved
+
+    def submit(self, X, live_class, live_seconds, session=None, model_version=None):
+        """
+        Queues X for the candidate. live_class and live_seconds are the live
+        model's prediction and latency for the same request.
+        """
+        self.submitted += 1
+        reserved = self._take_slot()
+        if reserved is None:
+            count("shadow_skipped")
+            return False
+        self._pool.submit(self._score, reserved, X, live_class, live_seconds, session, model_version)
+        return True
+
+    def _score(self, reserved, X, live_class, live_seconds, session, model_version):
+        cpu_start = time.thread_time()
+        try:
+            started = time.perf_counter()
+            with timed("shadow_predict"):
+                if self.same_path:
+                    probabilities, _ = self.candidate.explain(X)
+                    shadow_class = self.candidate.classes_[probabilities[0].argmax()]
+                else:
+                    shadow_class = self.candidate.predict(X)[0]
+            shadow_seconds = time.perf_counter() - started
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            return
+        finally:
+            cpu = time.thread_time() - cpu_start
+            with self._lock:
+                self._tokens += reserved - cpu
+                self.cpu_seconds += cpu
+                self._pending -= 1
+
+        agree = shadow_class == live_class
+        with self._lock:
+            self.scored += 1
+            self.agreed += agree
+            self.latency_deltas.append(shadow_seconds - live_seconds)
+        count("shadow_agree" if agree else "shadow_disagree")
+
+        get_event_log().emit(
+            "shadow_scored",
+            session=session,
+            model_version=model_version,
+            shadow_version=self.version,
+            live_class=str(live_class),
+            shadow_class=str(shadow_class),
+            live_ms=round(1000 * live_seconds, 3),
+            shadow_ms=round(1000 * shadow_seconds, 3)
+        )
+
+    def summary(self):
+        with self._lock:
+            deltas = np.array(self.latency_deltas) * 1000
+            return {
+                "candidate": self.version,
+                "scored via": "explain (same as live)" if self.same_path else "predict",
+                "submitted": self.submitted,
+                "scored": self.scored,
+                "agreement": self.agreed / self.scored if self.scored else float("nan"),
+                "skipped (busy)": self.skipped_busy,
+                "skipped (CPU cap)": self.skipped_cpu,
+                "failed": self.failed,
+                "CPU seconds": round(self.cpu_seconds, 3),
+                "latency delta p50 (ms)": float(np.median(deltas)) if len(deltas) else float("nan"),
+                "latency delta p95 (ms)": float(np.quantile(deltas, 0.95)) if len(deltas) else float("nan")
+            }
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+_shadow = None
+_shadow_error = None
+_shadow_loader = None
+_shadow_lock = threading.Lock()
+
+def _load_shadow():
+    global _shadow, _shadow_error
+    try:
+        with timed("shadow_load"):
+            candidate = candidate_scorer(joblib.load(SHADOW_MODEL_PATH))
+    except Exception as exc:
+        _shadow_error = exc
+        return
+    shadow = ShadowEvaluator(candidate, os.path.basename(SHADOW_MODEL_PATH))
+    atexit.register(shadow.close)
+    _shadow = shadow
+
+def start_shadow():
+    """
+    Starts loading the candidate model on a background thread, once, so
+    no request waits for it. Does nothing when shadow mode is off.
+    """
+    global _shadow_loader
+    if not SHADOW_MODEL_PATH:
+        return
+    with _shadow_lock:
+        if _shadow_loader is None:
+            _shadow_loader = threading.Thread(target=_load_shadow, name="shadow-loader", daemon=True)
+            _shadow_loader.start()
+
+def get_shadow():
+    """
+    Returns the process-wide shadow evaluator, or None when shadow mode
+    is off or the candidate is still loading (or failed to load, see
+    shadow_error()).
+    """
+    start_shadow()
+    return _shadow
+
+def shadow_error():
+    return _shadow_error
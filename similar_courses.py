@@ -0,0 +1,239 @@
+import time
+
+import numpy as np
+
+# =====================================================
+# Hashed character n-gram embeddings
+# =====================================================
+def embed_titles(titles, dim=128, max_len=96, chunk_size=100_000):
+    """
+    Embeds titles as L2-normalized hashed character trigram vectors.
+
+    Everything is computed with NumPy on a fixed-width byte matrix, so no
+    vocabulary, network access or pretrained model is needed and the same
+    title always maps to the same vector.
+    """
+    if dim & (dim - 1):
+        raise ValueError("dim must be a power of two")
+
+    titles = list(titles)
+    vectors = np.zeros((len(titles), dim), dtype=np.float32)
+    shift = 32 - int(np.log2(dim))
+
+    for start in range(0, len(titles), chunk_size):
+        chunk = titles[start:start + chunk_size]
+        raw = np.array(
+            [b" " + str(t).lower().encode("utf-8") + b" " for t in chunk],
+            dtype=f"S{max_len}"
+        )
+        data = raw.view(np.uint8).reshape(len(chunk), max_len).astype(np.uint32)
+
+        a, b, c = data[:, :-2], data[:, 1:-1], data[:, 2:]
+        valid = c != 0
+        h = ((a << 16) | (b << 8) | c) * np.uint32(2654435761)
+        bucket = (h >> np.uint32(shift)).astype(np.int64)
+        # The bit just below the bucket bits: the multiplier is odd, so the
+        # low bit would only repeat the low bit of the trigram's last byte
+        sign = np.where((h >> np.uint32(shift - 1)) & np.uint32(1), 1.0, -1.0)
+
+        rows = np.broadcast_to(np.arange(len(chunk))[:, None], bucket.shape)
+        counts = np.bincount(
+            (rows * dim + bucket)[valid],
+            weights=sign[valid],
+            minlength=len(chunk) * dim
+        )
+        vectors[start:start + len(chunk)] = counts.reshape(len(chunk), dim)
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+# =====================================================
+# Random-projection LSH index
+# =====================================================
+class SimilarCourseIndex:
+    """
+    Approximate nearest-neighbour index over title embeddings.
+
+    Each of n_tables tables hashes a vector to an n_bits signature made of
+    the signs of random projections. Codes are kept sorted per table, so a
+    query only reads the buckets matching its own signature (plus the
+    buckets one bit-flip away) and re-ranks that small candidate set by
+    exact cosine similarity.
+
+    Below EXACT_SEARCH_BELOW courses a full scan is faster than probing
+    the tables, so small catalogs are queried exactly.
+    """
+
+    EXACT_SEARCH_BELOW = 20_000
+
+    def __init__(self, vectors, planes, codes, order):
+        self.vectors = vectors
+        self.planes = planes
+        self.codes = codes
+        self.order = order
+
+    @classmethod
+    def build(cls, vectors, n_tables=24, n_bits=None, seed=42):
+        if n_bits is None:
+            # Aim for roughly 16 courses per bucket
+            n_bits = int(np.clip(np.log2(max(len(vectors), 1)) - 4, 4, 24))
+
+        rng = np.random.default_rng(seed)
+        planes = rng.standard_normal(
+            (n_tables, vectors.shape[1], n_bits)
+        ).astype(np.float32)
+
+        codes = np.empty((n_tables, len(vectors)), dtype=np.uint32)
+        order = np.empty((n_tables, len(vectors)), dtype=np.int32)
+        for t in range(n_tables):
+            table_codes = _signatures(vectors, planes[t])
+            order[t] = np.argsort(table_codes, kind="stable")
+            codes[t] = table_codes[order[t]]
+        return cls(vectors, planes, codes, order)
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def save(self, path):
+        np.savez(
+            path,
+            vectors=self.vectors,
+            planes=self.planes,
+            codes=self.codes,
+            order=self.order
+        )
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        return cls(data["vectors"], data["planes"], data["codes"], data["order"])
+
+    def candidates(self, query, multiprobe=True):
+        """
+        Returns the ids sharing a bucket with query in any table.
+        """
+        n_bits = self.planes.shape[2]
+        weights = np.uint32(1) << np.arange(n_bits, dtype=np.uint32)
+        bits = np.einsum("d,tdb->tb", query, self.planes) > 0
+        codes = (bits * weights).sum(axis=1, dtype=np.uint32)
+
+        found = []
+        for t, code in enumerate(codes):
+            probes = code ^ weights if multiprobe else np.empty(0, np.uint32)
+            probes = np.append(probes, code)
+            lo = np.searchsorted(self.codes[t], probes, side="left")
+            hi = np.searchsorted(self.codes[t], probes, side="right")
+            found.extend(self.order[t, a:b] for a, b in zip(lo, hi) if b > a)
+
+        if not found:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate(found))
+
+    def query(self, query, k=5, exclude=None):
+        """
+        Returns up to k (course_id, cosine_similarity) pairs.
+        """
+        if len(self) < self.EXACT_SEARCH_BELOW:
+            ids = brute_force_neighbours(self.vectors, query, k=k, exclude=exclude)
+            return [(int(i), float(self.vectors[i] @ query)) for i in ids]
+        return self.query_approximate(query, k=k, exclude=exclude)
+
+    def query_approximate(self, query, k=5, exclude=None, multiprobe=True):
+        ids = self.candidates(query, multiprobe=multiprobe)
+        if exclude is not None:
+            ids = ids[ids != exclude]
+        if len(ids) == 0:
+            return []
+
+        scores = self.vectors[ids] @ query
+        top = np.argsort(-scores, kind="stable")[:k]
+        return [(int(ids[i]), float(scores[i])) for i in top]
+
+    def similar_to(self, course_id, k=5):
+        return self.query(self.vectors[course_id], k=k, exclude=course_id)
+
+def _signatures(vectors, planes):
+    bits = (vectors @ planes) > 0
+    weights = np.uint32(1) << np.arange(planes.shape[1], dtype=np.uint32)
+    return (bits * weights).sum(axis=1, dtype=np.uint32)
+
+def brute_force_neighbours(vectors, query, k=5, exclude=None):
+    scores = vectors @ query
+    if exclude is not None:
+        scores[exclude] = -np.inf
+    k = min(k, len(scores) - (exclude is not None))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
+
+# =====================================================
+# Recall benchmark
+# =====================================================
+def synthetic_titles(source_titles, n, seed=0):
+    """
+    Builds n fake course titles from the words of the real catalog.
+    """
+    rng = np.random.default_rng(seed)
+    words = np.array(sorted({w for t in source_titles for w in str(t).split()}))
+    lengths = rng.integers(2, 7, n)
+    picks = words[rng.integers(0, len(words), lengths.sum())]
+    bounds = np.concatenate([[0], np.cumsum(lengths)])
+    return [" ".join(picks[bounds[i]:bounds[i + 1]]) for i in range(n)]
+
+def measure_recall(index, n_queries=200, k=10, seed=0):
+    rng = np.random.default_rng(seed)
+    query_ids = rng.choice(len(index), size=min(n_queries, len(index)), replace=False)
+
+    hits = 0
+    ann_time = brute_time = 0.0
+    candidates = 0
+    for qid in query_ids:
+        query = index.vectors[qid]
+
+        start = time.perf_counter()
+        approx = index.query_approximate(query, k=k, exclude=qid)
+        ann_time += time.perf_counter() - start
+        candidates += len(index.candidates(query))
+
+        start = time.perf_counter()
+        exact = brute_force_neighbours(index.vectors, query, k=k, exclude=qid)
+        brute_time += time.perf_counter() - start
+
+        hits += len({i for i, _ in approx} & set(exact.tolist()))
+
+    n = len(query_ids)
+    return {
+        "courses": len(index),
+        "recall@k": hits / (n * k),
+        "mean_candidates": candidates / n,
+        "ann_ms": 1000 * ann_time / n,
+        "brute_force_ms": 1000 * brute_time / n
+    }
+
+if __name__ == "__main__":
+    import argparse
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description="Build the similar-courses index")
+    parser.add_argument("--catalog", default="data/coursea_data.csv")
+    parser.add_argument("--output", default="course_similarity.npz")
+    parser.add_argument("--benchmark", action="store_true")
+    parser.add_argument("--synthetic", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    titles = pd.read_csv(args.catalog)["course_title"].fillna("").tolist()
+    index = SimilarCourseIndex.build(embed_titles(titles))
+    index.save(args.output)
+    print(f"✅ Similar-courses index saved as {args.output}")
+
+    if args.benchmark:
+        print("Bundled catalog:", measure_recall(index))
+
+        start = time.perf_counter()
+        fake = SimilarCourseIndex.build(
+            embed_titles(synthetic_titles(titles, args.synthetic))
+        )
+        print(f"Synthetic index built in {time.perf_counter() - start:.1f}s")
+        print("Synthetic catalog:", measure_recall(fake))
@@ -0,0 +1,129 @@
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+# =====================================================
+# Bundle file format
+# =====================================================
+# [magic 8 bytes][format version uint32][toc length uint64][toc JSON]
+# followed by raw little-endian arrays, each aligned to ALIGN bytes.
+# The table of contents maps array names to dtype, shape and offset, and
+# carries a free-form "meta" object.
+MAGIC = b"SMSBNDL1"
+FORMAT_VERSION = 1
+ALIGN = 64
+HEADER = struct.Struct("<8sIQ")
+
+def _aligned(offset):
+    return -(-offset // ALIGN) * ALIGN
+
+def write_bundle(path, arrays, meta=None):
+    """
+    Writes arrays (name -> ndarray) and meta into a single bundle file.
+    The file is written next to path and renamed into place, so readers
+    never open a partial bundle.
+    """
+    arrays = {name: np.ascontiguousarray(a) for name, a in arrays.items()}
+
+    entries = {}
+    offset = 0
+    for name, array in arrays.items():
+        offset = _aligned(offset)
+        entries[name] = {
+            "dtype": array.dtype.newbyteorder("<").str,
+            "shape": list(array.shape),
+            "offset": offset,
+            "nbytes": array.nbytes
+        }
+        offset += array.nbytes
+
+    toc = json.dumps({"arrays": entries, "meta": meta or {}}).encode("utf-8")
+    data_start = _aligned(HEADER.size + len(toc))
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(toc)))
+        f.write(toc)
+        for name, array in arrays.items():
+            f.seek(data_start + entries[name]["offset"])
+            f.write(array.astype(entries[name]["dtype"], copy=False).tobytes())
+        f.truncate(data_start + _aligned(offset))
+    os.replace(tmp, path)
+
+class Bundle:
+    """
+    Read-only view of a bundle file through a single mmap.
+
+    Arrays are np.frombuffer views into the mapping, so opening the file
+    costs one small JSON parse, and processes that open the same file
+    share the pages of numeric arrays through the page cache. Packed
+    string columns are the exception: unpack_strings decodes them row by
+    row into Python strings owned by each process.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, toc_len = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a state bundle")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} has bundle format {version}, expected {FORMAT_VERSION}")
+
+        toc = json.loads(bytes(self._mmap[HEADER.size:HEADER.size + toc_len]))
+        self.entries = toc["arrays"]
+        self.meta = toc["meta"]
+        self._data_start = _aligned(HEADER.size + toc_len)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __getitem__(self, name):
+        entry = self.entries[name]
+        dtype = np.dtype(entry["dtype"])
+        count = entry["nbytes"] // dtype.itemsize
+        array = np.frombuffer(
+            self._mmap, dtype=dtype, count=count,
+            offset=self._data_start + entry["offset"]
+        )
+        return array.reshape(entry["shape"])
+
+    def names(self, prefix=""):
+        return [name for name in self.entries if name.startswith(prefix)]
+
+# =====================================================
+# String columns
+# =====================================================
+def pack_strings(values, prefix):
+    """
+    Packs a sequence of strings (None/NaN allowed) into UTF-8 bytes,
+    offsets and a null mask, named <prefix>.data/.offsets/.null.
+    """
+    null = np.array([not isinstance(v, str) for v in values], dtype=bool)
+    encoded = [b"" if n else v.encode("utf-8") for v, n in zip(values, null)]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    return {
+        f"{prefix}.data": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        f"{prefix}.offsets": offsets,
+        f"{prefix}.null": null
+    }
+
+def unpack_strings(bundle, prefix):
+    """
+    Decodes a packed string column into an object array (None for nulls).
+    This parses and copies every row; the result is not shared between
+    processes.
+    """
+    data = bundle[f"{prefix}.data"].tobytes()
+    offsets = bundle[f"{prefix}.offsets"]
+    null = bundle[f"{prefix}.null"]
+    return np.array([
+        None if null[i] else data[offsets[i]:offsets[i + 1]].decode("utf-8")
+        for i in range(len(null))
+    ], dtype=object)
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
+
+# =====================================================
+# Student profile schema
+# =====================================================
+INTERESTS = ["Data Science", "Business", "Computer Science"]
+CAREER_GOALS = ["Data Analyst", "Software Engineer", "Business Analyst"]
+SKILL_LEVELS = ["Beginner", "Intermediate", "Advanced"]
+
+CATEGORICAL_FEATURES = ["interest", "career_goal", "skill_level"]
+FEATURES = ["cgpa"] + CATEGORICAL_FEATURES
+TARGET = "recommended_type"
+
+# =====================================================
+# Synthetic student data
+# =====================================================
+def generate_students(n=400, seed=42):
+    """
+    Generates n synthetic student profiles with their recommended course type.
+    Seed 42 reproduces the data course_model.pkl was trained on.
+    """
+    rng = np.random.RandomState(seed)
+
+    students = pd.DataFrame({
+        "cgpa": np.round(rng.uniform(2.5, 4.0, n), 2),
+        "interest": rng.choice(INTERESTS, n),
+        "career_goal": rng.choice(CAREER_GOALS, n),
+        "skill_level": rng.choice(SKILL_LEVELS, n)
+    })
+
+    # Target variable based on career_goal
+    students[TARGET] = np.where(
+        students["career_goal"] == "Data Analyst", "Data",
+        np.where(students["career_goal"] == "Software Engineer", "Programming", "Business")
+    )
+    return students
+
+# =====================================================
+# Preprocessing pipeline
+# =====================================================
+def build_pipeline(classifier=None):
+    """
+    One-hot encodes the categorical features, passes cgpa through and
+    feeds the result to classifier (LogisticRegression by default).
+    """
+    preprocess = ColumnTransformer(
+        transformers=[
+            ("cat", OneHotEncoder(handle_unknown="ignore"), CATEGORICAL_FEATURES),
+            ("num", "passthrough", ["cgpa"])
+        ]
+    )
+
+    if classifier is None:
+        classifier = LogisticRegression(max_iter=1000)
+
+    return Pipeline([
+        ("preprocess", preprocess),
+        ("classifier", classifier)
+    ])
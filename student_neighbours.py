@@ -0,0 +1,193 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from student_data import CATEGORICAL_FEATURES, INTERESTS, CAREER_GOALS, SKILL_LEVELS, TARGET
+
+# =====================================================
+# Settings
+# =====================================================
+CATEGORIES = {
+    "interest": INTERESTS,
+    "career_goal": CAREER_GOALS,
+    "skill_level": SKILL_LEVELS
+}
+
+# =====================================================
+# Bucketed exact k-NN
+# =====================================================
+class StudentNeighbours:
+    """
+    Exact k-nearest-neighbour search over encoded student profiles
+    (one-hot interest / career_goal / skill_level plus raw cgpa, the
+    model's feature space), by squared Euclidean distance.
+
+    Two one-hot blocks contribute 0 to the distance when they agree and 2
+    when they differ, so every profile in one categorical combination
+    (bucket) is at the same "penalty" from a query, and only cgpa varies
+    inside a bucket. Each bucket keeps its cgpa values sorted, so its k
+    nearest are found with one binary search. Buckets are visited in
+    order of penalty and the search stops once the next penalty cannot
+    beat the k-th best distance found.
+    """
+
+    def __init__(self, cgpa, codes, outcomes, outcome_labels, categories=CATEGORIES):
+        self.categories = categories
+        self.features = list(categories)
+        self.outcome_labels = list(outcome_labels)
+        # Own copies: the caller's arrays may live in memory it releases
+        # (e.g. synthetic_students shared memory)
+        self.outcomes = np.array(outcomes)
+        cgpa = np.array(cgpa, dtype=float)
+
+        sizes = [len(categories[f]) for f in self.features]
+        codes = np.asarray(codes, dtype=np.int64)
+        keys = np.ravel_multi_index(tuple(codes.T), sizes)
+
+        self.order = np.lexsort((cgpa, keys))
+        self.sorted_cgpa = cgpa[self.order]
+        n_buckets = int(np.prod(sizes))
+        self.bucket_starts = np.searchsorted(keys[self.order], np.arange(n_buckets + 1))
+        self.bucket_codes = np.stack(np.unravel_index(np.arange(n_buckets), sizes), axis=1)
+
+    @classmethod
+    def from_frame(cls, students):
+        """
+        Builds the index from a DataFrame in the student_data schema.
+        """
+        codes = np.column_stack([
+            pd.Index(labels).get_indexer(students[f])
+            for f, labels in CATEGORIES.items()
+        ])
+        if (codes < 0).any():
+            raise ValueError("students contain values outside the profile schema")
+        outcomes = pd.Categorical(students[TARGET])
+        return cls(
+            students["cgpa"].to_numpy(dtype=float), codes,
+            outcomes.codes, outcomes.categories.astype(str)
+        )
+
+    @classmethod
+    def from_columns(cls, columns, outcome_labels):
+        """
+        Builds the index from synthetic_students.StudentColumns codes.
+        """
+        codes = np.column_stack([columns[f] for f in CATEGORICAL_FEATURES])
+        return cls(columns["cgpa"], codes, columns[TARGET], outcome_labels)
+
+    def query_codes(self, profile):
+        # -1 for values the index has never seen: their one-hot block is
+        # all zeros, 1 away from every stored profile
+        return np.array([
+            self.categories[f].index(profile[f]) if profile[f] in self.categories[f] else -1
+            for f in self.features
+        ])
+
+    def query(self, profile, k=10):
+        """
+        Returns (row ids, squared distances) of the k students closest to
+        profile (a mapping with cgpa and the categorical features), closest
+        first.
+        """
+        q = self.query_codes(profile)
+        cgpa = float(profile["cgpa"])
+
+        penalty = np.where(q < 0, 1, np.where(self.bucket_codes == q, 0, 2)).sum(axis=1)
+        ids, distances = [], []
+        kth = np.inf
+        for level in np.unique(penalty):
+            if level >= kth:
+                break
+            for bucket in np.flatnonzero(penalty == level):
+                start, stop = self.bucket_starts[bucket], self.bucket_starts[bucket + 1]
+                if start == stop:
+                    continue
+                values = self.sorted_cgpa[start:stop]
+                pos = np.searchsorted(values, cgpa)
+                lo, hi = max(0, pos - k), min(len(values), pos + k)
+                ids.append(self.order[start + lo:start + hi])
+                distances.append(level + (values[lo:hi] - cgpa) ** 2)
+            if distances:
+                pooled = np.concatenate(distances)
+                if len(pooled) >= k:
+                    kth = np.partition(pooled, k - 1)[k - 1]
+
+        if not ids:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        ids, distances = np.concatenate(ids), np.concatenate(distances)
+        top = np.argsort(distances, kind="stable")[:k]
+        return ids[top], distances[top]
+
+    def outcome_shares(self, ids):
+        """
+        Fraction of the given students per outcome label, largest first.
+        """
+        counts = np.bincount(self.outcomes[ids], minlength=len(self.outcome_labels))
+        shares = pd.Series(counts / max(1, len(ids)), index=self.outcome_labels)
+        return shares[shares > 0].sort_values(ascending=False)
+
+# =====================================================
+# Brute force reference
+# =====================================================
+def encode_profiles(cgpa, codes, categories=CATEGORIES):
+    blocks = []
+    for j, labels in enumerate(categories.values()):
+        onehot = np.zeros((len(codes), len(labels)), dtype=np.float32)
+        known = codes[:, j] >= 0
+        onehot[np.flatnonzero(known), codes[known, j]] = 1.0
+        blocks.append(onehot)
+    blocks.append(np.asarray(cgpa, dtype=np.float32)[:, None])
+    return np.hstack(blocks)
+
+def brute_force_neighbours(encoded, query, k=10):
+    distances = ((encoded - query) ** 2).sum(axis=1)
+    top = np.argpartition(distances, k - 1)[:k]
+    top = top[np.argsort(distances[top], kind="stable")]
+    return top, distances[top]
+
+if __name__ == "__main__":
+    import argparse
+
+    from synthetic_students import CATEGORIES as COLUMN_LABELS, generate
+
+    parser = argparse.ArgumentParser(description="Benchmark the students-like-you index against brute force")
+    parser.add_argument("--students", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=25)
+    args = parser.parse_args()
+
+    columns = generate(args.students, seed=7)
+    try:
+        start = time.perf_counter()
+        index = StudentNeighbours.from_columns(columns, COLUMN_LABELS[TARGET])
+        print(f"Index built over {args.students:,} students in {time.perf_counter() - start:.2f}s")
+
+        codes = np.column_stack([columns[f] for f in CATEGORICAL_FEATURES]).astype(np.int64)
+        encoded = encode_profiles(columns["cgpa"], codes)
+    finally:
+        columns.close()
+        columns.unlink()
+
+    rng = np.random.default_rng(0)
+    profiles = [{
+        "cgpa": round(rng.uniform(2.5, 4.0), 2),
+        **{f: labels[rng.integers(len(labels))] for f, labels in CATEGORIES.items()}
+    } for _ in range(args.queries)]
+
+    bucketed, brute, mismatches = [], [], 0
+    for profile in profiles:
+        start = time.perf_counter()
+        _, distances = index.query(profile, k=args.k)
+        bucketed.append(time.perf_counter() - start)
+
+        q = index.query_codes(profile)
+        query = encode_profiles([profile["cgpa"]], q[None, :])[0]
+        start = time.perf_counter()
+        _, expected = brute_force_neighbours(encoded, query, k=args.k)
+        brute.append(time.perf_counter() - start)
+        mismatches += not np.allclose(distances, expected, atol=1e-4)
+
+    print(f"Bucketed:    median {1000 * np.median(bucketed):.3f} ms/query")
+    print(f"Brute force: median {1000 * np.median(brute):.3f} ms/query")
+    print(f"Queries with different neighbour distances: {mismatches} of {args.queries}")
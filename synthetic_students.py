@@ -0,0 +1,190 @@
+import os
+import time
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+import pandas as pd
+
+from student_data import INTERESTS, CAREER_GOALS, SKILL_LEVELS
+
+# =====================================================
+# Column layout
+# =====================================================
+# Categorical columns are stored as uint8 codes into these lists.
+CATEGORIES = {
+    "interest": INTERESTS,
+    "career_goal": CAREER_GOALS,
+    "skill_level": SKILL_LEVELS,
+    "recommended_type": ["Business", "Data", "Programming"]
+}
+
+COLUMNS = {
+    "cgpa": np.float64,
+    "interest": np.uint8,
+    "career_goal": np.uint8,
+    "skill_level": np.uint8,
+    "recommended_type": np.uint8
+}
+
+# career_goal code -> recommended_type code (same rule as student_data)
+TARGET_BY_CAREER = np.array([
+    CATEGORIES["recommended_type"].index("Data"),
+    CATEGORIES["recommended_type"].index("Programming"),
+    CATEGORIES["recommended_type"].index("Business")
+], dtype=np.uint8)
+
+BLOCK_SIZE = 1_000_000
+
+# =====================================================
+# Column storage
+# =====================================================
+class StudentColumns:
+    """
+    Column arrays backed by shared memory or by memory-mapped .npy files.
+
+    Workers attach to the same storage through describe()/attach(), so
+    generated rows are written in place and never pickled back.
+    """
+
+    def __init__(self, n, output_dir=None, _attach=None):
+        self.n = n
+        self.output_dir = output_dir
+        self._segments = {}
+        self.arrays = {}
+
+        for name, dtype in COLUMNS.items():
+            if output_dir is not None:
+                path = os.path.join(output_dir, f"{name}.npy")
+                mode = "r+" if _attach else "w+"
+                self.arrays[name] = np.lib.format.open_memmap(
+                    path, mode=mode, dtype=dtype, shape=(n,)
+                )
+            else:
+                size = max(1, n * np.dtype(dtype).itemsize)
+                if _attach:
+                    segment = shared_memory.SharedMemory(name=_attach[name])
+                else:
+                    segment = shared_memory.SharedMemory(create=True, size=size)
+                self._segments[name] = segment
+                self.arrays[name] = np.ndarray((n,), dtype=dtype, buffer=segment.buf)
+
+    def describe(self):
+        names = {name: seg.name for name, seg in self._segments.items()}
+        return self.n, self.output_dir, names or None
+
+    @classmethod
+    def attach(cls, description):
+        n, output_dir, names = description
+        return cls(n, output_dir=output_dir, _attach=names or True)
+
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    def to_frame(self):
+        """
+        Returns a DataFrame copy with categorical columns decoded.
+        """
+        frame = {"cgpa": np.array(self.arrays["cgpa"])}
+        for name, labels in CATEGORIES.items():
+            frame[name] = pd.Categorical.from_codes(np.array(self.arrays[name]), labels)
+        return pd.DataFrame(frame)
+
+    def close(self):
+        self.arrays = {}
+        for segment in self._segments.values():
+            segment.close()
+
+    def unlink(self):
+        """
+        Frees shared memory segments (the owner calls this once).
+        """
+        for segment in self._segments.values():
+            segment.unlink()
+
+# =====================================================
+# Generation
+# =====================================================
+def fill_block(columns, start, stop, seed_sequence):
+    """
+    Fills rows [start, stop) from the block's own random stream.
+    """
+    rng = np.random.Generator(np.random.PCG64(seed_sequence))
+    n = stop - start
+
+    columns["cgpa"][start:stop] = np.round(rng.uniform(2.5, 4.0, n), 2)
+    columns["interest"][start:stop] = rng.integers(0, len(INTERESTS), n, dtype=np.uint8)
+    career = rng.integers(0, len(CAREER_GOALS), n, dtype=np.uint8)
+    columns["career_goal"][start:stop] = career
+    columns["skill_level"][start:stop] = rng.integers(0, len(SKILL_LEVELS), n, dtype=np.uint8)
+    columns["recommended_type"][start:stop] = TARGET_BY_CAREER[career]
+
+_worker_columns = None
+
+def _init_worker(description):
+    global _worker_columns
+    _worker_columns = StudentColumns.attach(description)
+
+def _run_block(task):
+    start, stop, seed_sequence = task
+    fill_block(_worker_columns, start, stop, seed_sequence)
+    return stop - start
+
+def block_tasks(n, seed, block_size=BLOCK_SIZE):
+    """
+    Splits n rows into fixed-size blocks, each with an independent seed
+    stream. Blocks depend only on n, seed and block_size, never on the
+    number of workers, which is what makes the output reproducible.
+    """
+    starts = range(0, n, block_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    return [(s, min(s + block_size, n), ss) for s, ss in zip(starts, seeds)]
+
+def generate(n, seed=42, workers=None, block_size=BLOCK_SIZE, output_dir=None):
+    """
+    Generates n synthetic students across a process pool.
+
+    With output_dir the columns are memory-mapped .npy files in that
+    directory, otherwise shared memory segments that the caller must
+    close() and unlink(). The result is bit-identical for a given seed
+    and block_size whatever the worker count.
+    """
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    columns = StudentColumns(n, output_dir=output_dir)
+    tasks = block_tasks(n, seed, block_size)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(tasks) == 1:
+        for start, stop, seed_sequence in tasks:
+            fill_block(columns, start, stop, seed_sequence)
+    else:
+        pool = get_context().Pool(
+            workers, initializer=_init_worker, initargs=(columns.describe(),)
+        )
+        with pool:
+            for _ in pool.imap_unordered(_run_block, tasks):
+                pass
+
+    if output_dir is not None:
+        for array in columns.arrays.values():
+            array.flush()
+    return columns
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate benchmark-scale synthetic students")
+    parser.add_argument("n", type=int)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--block-size", type=int, default=BLOCK_SIZE)
+    parser.add_argument("--output-dir", default=os.path.join("data", "synthetic_students"))
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    columns = generate(args.n, seed=args.seed, workers=args.workers,
+                       block_size=args.block_size, output_dir=args.output_dir)
+    elapsed = time.perf_counter() - start
+    columns.close()
+    print(f"✅ {args.n:,} students written to {args.output_dir} in {elapsed:.1f}s")
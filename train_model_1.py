@@ -1,11 +1,8 @@
 import pandas as pd
-import numpy as np
-from sklearn.linear_model import LogisticRegression
-from sklearn.pipeline import Pipeline
-from sklearn.compose import ColumnTransformer
-from sklearn.preprocessing import OneHotEncoder
 import joblib
 
+from student_data import generate_students, build_pipeline, FEATURES, TARGET
+
 # =====================================================
 # Load real course data (for later use in GUI)
 # =====================================================
@@ -15,42 +12,16 @@ courses = courses.loc[:, ~courses.columns.str.contains("^Unnamed")]
 # =====================================================
 # Generate synthetic student data
 # =====================================================
-np.random.seed(42)
-n = 400
-
-students = pd.DataFrame({
-    "cgpa": np.round(np.random.uniform(2.5, 4.0, n), 2),
-    "interest": np.random.choice(["Data Science", "Business", "Computer Science"], n),
-    "career_goal": np.random.choice(
-        ["Data Analyst", "Software Engineer", "Business Analyst"], n
-    ),
-    "skill_level": np.random.choice(["Beginner", "Intermediate", "Advanced"], n)
-})
-
-# Target variable based on career_goal
-students["recommended_type"] = np.where(
-    students["career_goal"] == "Data Analyst", "Data",
-    np.where(students["career_goal"] == "Software Engineer", "Programming", "Business")
-)
+students = generate_students(n=400, seed=42)
 
 # Features and target
-X = students[["cgpa", "interest", "career_goal", "skill_level"]]
-y = students["recommended_type"]
+X = students[FEATURES]
+y = students[TARGET]
 
 # =====================================================
 # Preprocessing pipeline
 # =====================================================
-preprocess = ColumnTransformer(
-    transformers=[
-        ("cat", OneHotEncoder(handle_unknown="ignore"), ["interest", "career_goal", "skill_level"]),
-        ("num", "passthrough", ["cgpa"])
-    ]
-)
-
-model = Pipeline([
-    ("preprocess", preprocess),
-    ("classifier", LogisticRegression(max_iter=1000))
-])
+model = build_pipeline()
 
 # Train model
 model.fit(X, y)